@@ -0,0 +1,45 @@
+"""export job bookkeeping and rate limit buckets
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 22:30:12.104518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('audit_exports', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('audit_exports', sa.Column('available_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('audit_exports', sa.Column('last_error', sa.Text(), nullable=True))
+
+    op.create_table('rate_limit_buckets',
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('window', sa.BigInteger(), nullable=False),
+    sa.Column('current', sa.Integer(), nullable=False),
+    sa.Column('previous', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_rate_limit_buckets_expires_at'), 'rate_limit_buckets', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_rate_limit_buckets_expires_at'), table_name='rate_limit_buckets')
+    op.drop_table('rate_limit_buckets')
+
+    op.drop_column('audit_exports', 'last_error')
+    op.drop_column('audit_exports', 'available_at')
+    op.drop_column('audit_exports', 'attempts')
@@ -0,0 +1,49 @@
+"""composite indexes for hot queries
+
+Built CONCURRENTLY outside the migration transaction so existing tables
+stay writable; check_query_plans.py verifies the planner uses them.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 22:41:37.529104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_evidence_org_control_created', 'evidence', ['organization_id', 'control_id', 'created_at']),
+    ('ix_evidence_org_created', 'evidence', ['organization_id', 'created_at']),
+    ('ix_evidence_org_control_file_version', 'evidence', ['organization_id', 'control_id', 'file_name', 'version']),
+    ('ix_evidence_org_file_url', 'evidence', ['organization_id', 'file_url']),
+    ('ix_tasks_org_status', 'tasks', ['organization_id', 'status']),
+    ('ix_tasks_org_control', 'tasks', ['organization_id', 'control_id']),
+    ('ix_tasks_owner_due', 'tasks', ['owner_id', 'due_date']),
+    ('ix_policies_org_created', 'policies', ['organization_id', 'created_at']),
+    ('ix_controls_framework_code', 'controls', ['framework_id', 'control_code']),
+    ('ix_audit_exports_org_created', 'audit_exports', ['organization_id', 'created_at']),
+    ('ix_audit_exports_status_created', 'audit_exports', ['status', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
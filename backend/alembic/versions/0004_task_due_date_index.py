@@ -0,0 +1,35 @@
+"""index for keyset-paginated task lists
+
+Task list pages are read in (due_date, id) order per organization.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 23:05:12.418390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_org_due', 'tasks', ['organization_id', 'due_date', 'id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_org_due', table_name='tasks', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,42 @@
+"""unique control codes per framework
+
+The control seeder upserts on (framework_id, control_code), which needs a
+unique index as its conflict target; it replaces the plain index from 0003.
+Building it fails if a framework already has duplicate control codes.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 23:48:26.731054
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_controls_framework_code', 'controls', ['framework_id', 'control_code'],
+            unique=True, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index('ix_controls_framework_code', table_name='controls', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_controls_framework_code', 'controls', ['framework_id', 'control_code'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index('uq_controls_framework_code', table_name='controls', postgresql_concurrently=True, if_exists=True)
@@ -9,8 +9,10 @@ from app.db.models.user import User
 from app.db.models.organization import Organization
 from app.schemas.user import UserCreate, UserRead, Token, LoginRequest
 from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.hashing import HashPoolBusyError
 from app.core.config import settings
-from app.core.dependencies import get_current_active_user
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_active_user, get_read_db
 from app.core.ratelimit import rate_limiter
 from app.core.logging_config import get_logger, log_auth, log_success, log_error, log_warning
 
@@ -18,6 +20,15 @@ router = APIRouter()
 logger = get_logger("api.auth")
 
 
+def password_hashing_busy() -> HTTPException:
+    log_warning(logger, "⚠️ Password hashing queue full, rejecting request")
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy. Please try again shortly.",
+        headers={"Retry-After": "1"}
+    )
+
+
 @router.post("/register", response_model=UserRead, dependencies=[Depends(rate_limiter(max_requests=5, window_seconds=60))])
 async def register(
     user_data: UserCreate,
@@ -52,10 +63,15 @@ async def register(
         organization_id = new_org.id
         log_auth(logger, f"🏢 Created new organization for user: {user_data.full_name}")
     
+    try:
+        hashed_password = await get_password_hash(user_data.password)
+    except HashPoolBusyError:
+        raise password_hashing_busy()
+
     # Create user
     new_user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
         full_name=user_data.full_name,
         role=user_data.role,
         organization_id=organization_id,
@@ -91,7 +107,12 @@ async def login(
         )
     
     # Verify password
-    if not verify_password(login_data.password, user.hashed_password):
+    try:
+        password_ok = await verify_password(login_data.password, user.hashed_password)
+    except HashPoolBusyError:
+        raise password_hashing_busy()
+
+    if not password_ok:
         log_warning(logger, f"⚠️ Login failed - Invalid password for: {login_data.email}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -119,10 +140,18 @@ async def login(
 
 @router.get("/me", response_model=UserRead)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    log_auth(logger, f"👤 User info requested: {current_user.email}")
-    return current_user
+    user = await db.get(User, current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+
+    log_auth(logger, f"👤 User info requested: {user.email}")
+    return user
 
 
 @router.post("/logout")
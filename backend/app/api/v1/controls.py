@@ -1,17 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from app.db.session import get_db
-from app.db.models.user import User
 from app.db.models.control import Control
-from app.db.models.framework import Framework
-from app.db.models.evidence import Evidence
-from app.db.models.task import Task
 from app.schemas.control import ControlCreate, ControlRead, ControlUpdate, ControlWithStatus
-from app.core.dependencies import get_current_active_user, require_roles
-from app.services.control_seeder import seed_controls
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_active_user, require_roles, get_read_db
+from app.core.pagination import PageRequest, page_request, page_etag, page_response, slice_page, validate_fields
+from app.core.etag import etag_matches, not_modified
+from app.services.catalog import CONTROL_ORDER, catalog_cache
+from app.services.control_status import get_control_statuses, control_with_status, NOT_STARTED
 
 router = APIRouter()
 
@@ -20,76 +19,60 @@ router = APIRouter()
 async def list_controls(
     framework: Optional[str] = Query(None, description="Filter by framework name"),
     category: Optional[str] = Query(None, description="Filter by category"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    page: PageRequest = Depends(page_request),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    query = select(Control)
-
-    if framework:
-        query = query.join(Framework).where(Framework.name.ilike(f"%{framework}%"))
-
-    if category:
-        query = query.where(Control.category.ilike(f"%{category}%"))
-
-    result = await db.execute(query.order_by(Control.control_code))
-    controls = result.scalars().all()
-
-    # Get evidence and task counts for each control
-    controls_with_status = []
-    for control in controls:
-        evidence_result = await db.execute(
-            select(Evidence).where(
-                Evidence.control_id == control.id,
-                Evidence.organization_id == current_user.organization_id
-            )
-        )
-        evidence_count = len(evidence_result.scalars().all())
+    """List controls; pass e.g. ``fields=id,control_code,title,completion_status`` to skip the long texts."""
+    if page.fields:
+        validate_fields(ControlWithStatus, page.fields)
+
+    # Filtering and paging run over the cached catalog; only the counts hit the database
+    catalog = await catalog_cache.get()
+    controls, next_cursor = slice_page(catalog.filter(framework, category), page, CONTROL_ORDER)
+
+    # Evidence and task counts for the page in two grouped queries
+    whole_catalog = len(controls) == len(catalog.controls)
+    statuses = await get_control_statuses(
+        db,
+        current_user.organization_id,
+        control_ids=None if whole_catalog else [c.id for c in controls]
+    )
 
-        task_result = await db.execute(
-            select(Task).where(
-                Task.control_id == control.id,
-                Task.organization_id == current_user.organization_id
-            )
-        )
-        tasks = task_result.scalars().all()
-        task_count = len(tasks)
-
-        # Determine completion status
-        if evidence_count > 0 and all(t.status == "Completed" for t in tasks):
-            completion_status = "Completed"
-        elif evidence_count > 0 or any(t.status == "In Progress" for t in tasks):
-            completion_status = "In Progress"
-        else:
-            completion_status = "Not Started"
-
-        control_dict = {
-            "id": control.id,
-            "framework_id": control.framework_id,
-            "control_code": control.control_code,
-            "title": control.title,
-            "description": control.description,
-            "category": control.category,
-            "severity": control.severity,
-            "guidance_text": control.guidance_text,
-            "evidence_guidance": control.evidence_guidance,
-            "created_at": control.created_at,
-            "evidence_count": evidence_count,
-            "task_count": task_count,
-            "completion_status": completion_status
-        }
-        controls_with_status.append(ControlWithStatus(**control_dict))
-
-    return controls_with_status
+    # Counts are per organization, so they are part of the tag along with the rows
+    etag = page_etag(page, controls, (Control.updated_at,), sorted(
+        (control_id, s.evidence_count, s.task_count, s.completion_status) for control_id, s in statuses.items()
+    ))
+    if etag_matches(page.request, etag):
+        return not_modified(etag)
+
+    items: List[Union[ControlWithStatus, Dict[str, Any]]]
+    if page.fields is None:
+        items = [
+            control_with_status(control, statuses.get(control.id, NOT_STARTED))
+            for control in controls
+        ]
+    else:
+        items = []
+        for control in controls:
+            control_status = statuses.get(control.id, NOT_STARTED)
+            items.append({
+                **control.as_dict(),
+                "evidence_count": control_status.evidence_count,
+                "task_count": control_status.task_count,
+                "completion_status": control_status.completion_status,
+            })
+    return page_response(page, items, next_cursor, etag)
 
 
 @router.get("/{control_id}", response_model=ControlWithStatus)
 async def get_control(
     control_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    result = await db.execute(select(Control).where(Control.id == control_id))
-    control = result.scalar_one_or_none()
+    catalog = await catalog_cache.get()
+    control = catalog.by_id.get(control_id)
 
     if not control:
         raise HTTPException(
@@ -97,54 +80,20 @@ async def get_control(
             detail="Control not found"
         )
 
-    # Get evidence count
-    evidence_result = await db.execute(
-        select(Evidence).where(
-            Evidence.control_id == control.id,
-            Evidence.organization_id == current_user.organization_id
-        )
-    )
-    evidence_count = len(evidence_result.scalars().all())
-
-    # Get task count
-    task_result = await db.execute(
-        select(Task).where(
-            Task.control_id == control.id,
-            Task.organization_id == current_user.organization_id
-        )
+    statuses = await get_control_statuses(
+        db, current_user.organization_id, control_ids=[control.id]
     )
-    tasks = task_result.scalars().all()
-    task_count = len(tasks)
 
-    if evidence_count > 0 and all(t.status == "Completed" for t in tasks):
-        completion_status = "Completed"
-    elif evidence_count > 0 or any(t.status == "In Progress" for t in tasks):
-        completion_status = "In Progress"
-    else:
-        completion_status = "Not Started"
-
-    return ControlWithStatus(
-        id=control.id,
-        framework_id=control.framework_id,
-        control_code=control.control_code,
-        title=control.title,
-        description=control.description,
-        category=control.category,
-        severity=control.severity,
-        guidance_text=control.guidance_text,
-        evidence_guidance=control.evidence_guidance,
-        created_at=control.created_at,
-        evidence_count=evidence_count,
-        task_count=task_count,
-        completion_status=completion_status
-    )
+    return control_with_status(control, statuses.get(control.id, NOT_STARTED))
 
 
 @router.post("/seed")
 async def seed_control_library(
-    current_user: User = Depends(require_roles(["Founder", "Admin"])),
+    current_user: Principal = Depends(require_roles(["Founder", "Admin"])),
     db: AsyncSession = Depends(get_db)
 ):
-    """Seed the database with SOC 2 and ISO 27001 controls"""
-    await seed_controls(db)
-    return {"message": "Controls seeded successfully"}
+    """Insert or update the SOC 2, ISO 27001 and GDPR control library"""
+    from app.services.control_seeder import seed_controls
+
+    result = await seed_controls(db)
+    return {"message": "Controls seeded successfully", **result.as_dict()}
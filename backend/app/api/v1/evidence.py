@@ -1,44 +1,46 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from typing import List, Optional
-import hashlib
-import aiofiles
-import os
-from datetime import datetime
 
 from app.db.session import get_db
-from app.db.models.user import User
 from app.db.models.evidence import Evidence
 from app.schemas.evidence import EvidenceCreate, EvidenceRead, EvidenceUpdate
-from app.core.dependencies import get_current_active_user, require_roles
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_active_user, require_roles, get_read_db
+from app.core.ratelimit import rate_limiter
+from app.core.pagination import PageRequest, SortKey, page_request, paginate
+from app.core.config import settings
+from app.services.evidence_store import evidence_store
+from app.storage import storage
+from app.storage.responses import download_response
+from app.utils.upload import UploadTooLargeError
 
 router = APIRouter()
 
-UPLOAD_DIR = "uploads/evidence"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+EVIDENCE_ORDER = (SortKey(Evidence.created_at, descending=True), SortKey(Evidence.id, descending=True))
 
 
 @router.get("", response_model=List[EvidenceRead])
 async def list_evidence(
     control_id: Optional[int] = None,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    page: PageRequest = Depends(page_request),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     query = select(Evidence).where(Evidence.organization_id == current_user.organization_id)
 
     if control_id:
         query = query.where(Evidence.control_id == control_id)
 
-    result = await db.execute(query.order_by(Evidence.created_at.desc()))
-    return result.scalars().all()
+    return await paginate(db, query, page, EVIDENCE_ORDER, EvidenceRead)
 
 
 @router.get("/control/{control_id}", response_model=List[EvidenceRead])
 async def get_evidence_for_control(
     control_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     result = await db.execute(
         select(Evidence).where(
@@ -49,59 +51,100 @@ async def get_evidence_for_control(
     return result.scalars().all()
 
 
-@router.post("/upload", response_model=EvidenceRead)
+@router.get("/{evidence_id}/download")
+async def download_evidence(
+    evidence_id: int,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    result = await db.execute(
+        select(Evidence.file_url, Evidence.file_name, Evidence.mime_type).where(
+            Evidence.id == evidence_id,
+            Evidence.organization_id == current_user.organization_id
+        )
+    )
+    evidence = result.one_or_none()
+
+    if not evidence:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence not found"
+        )
+
+    file_url, file_name, mime_type = evidence
+    try:
+        return await download_response(storage, file_url, file_name, mime_type)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence file not found"
+        )
+
+
+@router.post("/upload", response_model=EvidenceRead, dependencies=[Depends(rate_limiter(max_requests=30, window_seconds=60, key="user"))])
 async def upload_evidence(
     control_id: int = Form(...),
     description: Optional[str] = Form(None),
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # Read file content
-    content = await file.read()
-
-    # Calculate file hash
-    file_hash = hashlib.sha256(content).hexdigest()
-
-    # Generate unique filename
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_filename = f"{timestamp}_{file.filename}"
-    file_path = os.path.join(UPLOAD_DIR, str(current_user.organization_id), safe_filename)
-
-    # Create directory if needed
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    organization_id = current_user.organization_id
+    if not organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No organization found"
+        )
 
-    # Save file
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(content)
+    # Stream file into the content-addressed store; identical bytes are stored once per org
+    try:
+        blob = await evidence_store.put_upload(
+            db,
+            file,
+            organization_id,
+            max_size=settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024,
+            chunk_size=settings.UPLOAD_CHUNK_SIZE,
+            content_type=file.content_type
+        )
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds maximum size of {settings.MAX_UPLOAD_SIZE_MB} MB"
+        )
 
-    # Check for existing version
-    result = await db.execute(
-        select(Evidence).where(
-            Evidence.control_id == control_id,
-            Evidence.organization_id == current_user.organization_id,
-            Evidence.file_name == file.filename
-        ).order_by(Evidence.version.desc())
-    )
-    existing = result.scalar_one_or_none()
-    new_version = (existing.version + 1) if existing else 1
-
-    # Create evidence record
-    new_evidence = Evidence(
-        control_id=control_id,
-        organization_id=current_user.organization_id,
-        uploaded_by=current_user.id,
-        file_name=file.filename,
-        file_url=file_path,
-        file_hash=file_hash,
-        file_size=len(content),
-        mime_type=file.content_type,
-        description=description,
-        version=new_version,
-        status="Pending"
-    )
-    db.add(new_evidence)
-    await db.commit()
+    try:
+        # Latest existing version of this file, if any
+        latest_version = await db.scalar(
+            select(func.max(Evidence.version)).where(
+                Evidence.control_id == control_id,
+                Evidence.organization_id == organization_id,
+                Evidence.file_name == file.filename
+            )
+        )
+        new_version = (latest_version or 0) + 1
+
+        # Create evidence record; committing also releases the blob lock
+        new_evidence = Evidence(
+            control_id=control_id,
+            organization_id=organization_id,
+            uploaded_by=current_user.id,
+            file_name=file.filename,
+            file_url=blob.path,
+            file_hash=blob.sha256,
+            file_size=blob.size,
+            mime_type=file.content_type,
+            description=description,
+            version=new_version,
+            status="Pending"
+        )
+        db.add(new_evidence)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        if not blob.deduplicated:
+            # Nothing references the file just written unless another upload adopted it meanwhile
+            await evidence_store.remove_if_orphaned(db, organization_id, blob.path)
+        raise
     await db.refresh(new_evidence)
 
     return new_evidence
@@ -111,7 +154,7 @@ async def upload_evidence(
 async def update_evidence(
     evidence_id: int,
     update_data: EvidenceUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -142,7 +185,7 @@ async def update_evidence(
 async def update_evidence_status(
     evidence_id: int,
     status: str,
-    current_user: User = Depends(require_roles(["Founder", "Admin", "Auditor"])),
+    current_user: Principal = Depends(require_roles(["Founder", "Admin", "Auditor"])),
     db: AsyncSession = Depends(get_db)
 ):
     if status not in ["Pending", "Accepted", "Rejected"]:
@@ -175,16 +218,16 @@ async def update_evidence_status(
 @router.delete("/{evidence_id}")
 async def delete_evidence(
     evidence_id: int,
-    current_user: User = Depends(require_roles(["Founder", "Admin"])),
+    current_user: Principal = Depends(require_roles(["Founder", "Admin"])),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
-        select(Evidence).where(
+        select(Evidence.organization_id, Evidence.file_url).where(
             Evidence.id == evidence_id,
             Evidence.organization_id == current_user.organization_id
         )
     )
-    evidence = result.scalar_one_or_none()
+    evidence = result.one_or_none()
 
     if not evidence:
         raise HTTPException(
@@ -192,11 +235,11 @@ async def delete_evidence(
             detail="Evidence not found"
         )
 
-    # Delete file
-    if os.path.exists(evidence.file_url):
-        os.remove(evidence.file_url)
-
-    await db.delete(evidence)
+    organization_id, file_url = evidence
+    await db.execute(delete(Evidence).where(Evidence.id == evidence_id))
     await db.commit()
 
+    # Remove the stored file once no other evidence references it
+    await evidence_store.remove_if_orphaned(db, organization_id, file_url)
+
     return {"message": "Evidence deleted successfully"}
@@ -1,36 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
 
 from app.db.session import get_db
-from app.db.models.user import User
 from app.db.models.policy import Policy
 from app.schemas.policy import PolicyCreate, PolicyRead, PolicyUpdate, PolicyGenerate
-from app.core.dependencies import get_current_active_user, require_roles
-from app.services.policy_generator import generate_policy_content
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_active_user, require_roles, get_read_db
+from app.core.pagination import PageRequest, SortKey, page_request, paginate
+from app.core.etag import compute_etag, conditional_get, etag_headers, etag_matches, not_modified
+from app.services.policy_renderer import cache_policy_html, policy_html_cache
+from app.utils.markdown import FULL
 
 router = APIRouter()
 
+POLICY_ORDER = (SortKey(Policy.created_at, descending=True), SortKey(Policy.id, descending=True))
+
 
 @router.get("", response_model=List[PolicyRead])
 async def list_policies(
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    page: PageRequest = Depends(page_request),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    result = await db.execute(
-        select(Policy)
-        .where(Policy.organization_id == current_user.organization_id)
-        .order_by(Policy.created_at.desc())
-    )
-    return result.scalars().all()
+    """List policies; pass e.g. ``fields=id,title,status`` to leave out the Markdown content."""
+    query = select(Policy).where(Policy.organization_id == current_user.organization_id)
+    return await paginate(db, query, page, POLICY_ORDER, PolicyRead, versioned_by=(Policy.version, Policy.updated_at))
 
 
 @router.get("/{policy_id}", response_model=PolicyRead)
 async def get_policy(
     policy_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     result = await db.execute(
         select(Policy).where(
@@ -46,13 +54,54 @@ async def get_policy(
             detail="Policy not found"
         )
 
-    return policy
+    etag = compute_etag(policy.id, policy.version, policy.updated_at)
+    return conditional_get(request, response, etag) or policy
+
+
+@router.get("/{policy_id}/html", response_class=HTMLResponse)
+async def get_policy_html(
+    policy_id: int,
+    request: Request,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Policy content as HTML; each version is rendered once and then served from cache."""
+    result = await db.execute(
+        select(Policy.id, Policy.version).where(
+            Policy.id == policy_id,
+            Policy.organization_id == current_user.organization_id
+        )
+    )
+    policy = result.tuples().one_or_none()
+
+    if not policy:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Policy not found"
+        )
+
+    policy_id, version = policy
+    etag = compute_etag(policy_id, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    html = policy_html_cache.get((policy_id, version, FULL))
+    if html is None:
+        # Content is only read on a miss; it is rendered for the version read with it
+        version, content = (await db.execute(
+            select(Policy.version, Policy.content).where(Policy.id == policy_id)
+        )).tuples().one()
+        etag = compute_etag(policy_id, version)
+        html = await asyncio.to_thread(cache_policy_html, policy_id, version, content)
+
+    # Policy content is user-authored; keep scripts in it from running if opened directly
+    return HTMLResponse(html, headers={**etag_headers(etag), "Content-Security-Policy": "sandbox"})
 
 
 @router.post("", response_model=PolicyRead)
 async def create_policy(
     policy_data: PolicyCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     new_policy = Policy(
@@ -72,10 +121,11 @@ async def create_policy(
 @router.post("/generate", response_model=PolicyRead)
 async def generate_policy(
     generate_data: PolicyGenerate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     from app.db.models.organization import Organization
+    from app.services.policy_generator import generate_policy_content
 
     # Get organization name
     org_result = await db.execute(
@@ -108,7 +158,7 @@ async def generate_policy(
 async def update_policy(
     policy_id: int,
     update_data: PolicyUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -143,7 +193,7 @@ async def update_policy(
 @router.delete("/{policy_id}")
 async def delete_policy(
     policy_id: int,
-    current_user: User = Depends(require_roles(["Founder", "Admin"])),
+    current_user: Principal = Depends(require_roles(["Founder", "Admin"])),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
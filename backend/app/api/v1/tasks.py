@@ -4,21 +4,26 @@ from sqlalchemy import select
 from typing import List, Optional
 
 from app.db.session import get_db
-from app.db.models.user import User
 from app.db.models.task import Task
 from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
-from app.core.dependencies import get_current_active_user
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_active_user, get_read_db
+from app.core.pagination import PageRequest, SortKey, page_request, paginate
 
 router = APIRouter()
 
+# Soonest due first, undated tasks last
+TASK_ORDER = (SortKey(Task.due_date, nullable=True), SortKey(Task.id))
+
 
 @router.get("", response_model=List[TaskRead])
 async def list_tasks(
     status_filter: Optional[str] = Query(None, alias="status"),
     control_id: Optional[int] = None,
     owner_id: Optional[int] = None,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    page: PageRequest = Depends(page_request),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     query = select(Task).where(Task.organization_id == current_user.organization_id)
 
@@ -31,14 +36,13 @@ async def list_tasks(
     if owner_id:
         query = query.where(Task.owner_id == owner_id)
 
-    result = await db.execute(query.order_by(Task.due_date.asc().nullslast(), Task.created_at.desc()))
-    return result.scalars().all()
+    return await paginate(db, query, page, TASK_ORDER, TaskRead)
 
 
 @router.get("/my", response_model=List[TaskRead])
 async def get_my_tasks(
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     result = await db.execute(
         select(Task).where(
@@ -51,8 +55,8 @@ async def get_my_tasks(
 @router.get("/{task_id}", response_model=TaskRead)
 async def get_task(
     task_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     result = await db.execute(
         select(Task).where(
@@ -74,7 +78,7 @@ async def get_task(
 @router.post("", response_model=TaskRead)
 async def create_task(
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     new_task = Task(
@@ -98,7 +102,7 @@ async def create_task(
 async def update_task(
     task_id: int,
     update_data: TaskUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -128,7 +132,7 @@ async def update_task(
 @router.delete("/{task_id}")
 async def delete_task(
     task_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
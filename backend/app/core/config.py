@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -9,14 +10,99 @@ class Settings(BaseSettings):
 
     # Neon Auth
     NEON_AUTH_URL: str = ""
+    JWKS_CACHE_TTL_SECONDS: float = 300.0
+    JWKS_MIN_REFRESH_INTERVAL_SECONDS: float = 30.0
+    JWKS_MAX_BACKOFF_SECONDS: float = 300.0
 
     # JWT Settings
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
+
+    # Password hashing (argon2id); changing these only affects new hashes
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
+    # Rate limiting
+    RATE_LIMIT_BACKEND: str = "postgres"  # postgres (shared across workers) or memory (per process)
+    RATE_LIMIT_MEMORY_MAX_KEYS: int = 100_000
+
+    # Authenticated user cache (see app/core/principal_cache.py)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    # Framework and control catalog cache (see app/services/catalog.py)
+    CATALOG_CHECK_SECONDS: float = 30.0  # how often other workers' reseeds are looked for
+
+    # Rendered policy HTML, keyed by (policy id, version); 0 disables
+    POLICY_HTML_CACHE_SIZE: int = 256
     
     ENVIRONMENT: str = "development"
 
-    # REMOVED: All AWS settings - not needed
+    # Database engine (see app/db/engine.py); unset values come from DB_PROFILE
+    DB_PROFILE: str = ""  # dev, prod or pgbouncer; defaults to dev/prod from ENVIRONMENT
+    DB_ECHO: Optional[bool] = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None  # 100, or 0 behind pgbouncer
+    DB_STATEMENT_TIMEOUT_MS: int = 30_000
+    DB_POOL_WARMUP_CONNECTIONS: int = 2  # opened before the app reports ready
+
+    # Startup: "verify" the Alembic revision, "create_all" tables (local dev only) or "off"
+    STARTUP_SCHEMA_CHECK: str = "verify"
+    STARTUP_PROFILE: bool = False  # log the slowest module imports at boot
+
+    # Read replica for GET endpoints; empty means reads use DATABASE_URL
+    DATABASE_READ_URL: str = ""
+    # Keep a user's reads on the primary this long after they write, in the process that
+    # served the write; defaults to 5 with a replica, 0 without
+    READ_YOUR_WRITES_SECONDS: Optional[float] = None
+
+    # Fraction of successful (< 400) requests logged by LoggingMiddleware
+    LOG_SUCCESS_SAMPLE_RATE: float = 1.0
+    LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_FILE_BACKUP_COUNT: int = 5
+    LOG_QUEUE_SIZE: int = 10_000  # records beyond this are dropped rather than blocking requests
+
+    # Bearer token for /metrics; when empty, /metrics is only served in development
+    METRICS_TOKEN: str = ""
+
+    # Evidence uploads
+    MAX_UPLOAD_SIZE_MB: int = 100
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+
+    # Audit export workers
+    EXPORT_QUEUE_BACKEND: str = "postgres"  # postgres, memory
+    EXPORT_WORKERS: int = 2
+    EXPORT_MAX_ATTEMPTS: int = 3
+    EXPORT_RETRY_BACKOFF_SECONDS: float = 5.0
+    EXPORT_POLL_INTERVAL_SECONDS: float = 2.0
+    EXPORT_JOB_TIMEOUT_SECONDS: float = 900.0  # exports running longer are abandoned and retried
+
+    # File storage for evidence and audit exports
+    STORAGE_BACKEND: str = "local"  # local, s3
+    STORAGE_LOCAL_ROOT: str = "."
+    S3_BUCKET: str = ""
+    S3_REGION: str = "us-east-1"
+    S3_ENDPOINT_URL: str = ""  # e.g. http://localhost:9000 for MinIO
+    S3_ACCESS_KEY_ID: str = ""
+    S3_SECRET_ACCESS_KEY: str = ""
+    PRESIGNED_DOWNLOADS: bool = True
+    PRESIGNED_URL_EXPIRE_SECONDS: int = 300
+
+    # List endpoints: page size when only ?cursor= is passed, and the upper bound of ?limit=
+    PAGINATION_DEFAULT_LIMIT: int = 100
+    PAGINATION_MAX_LIMIT: int = 500
+
+    # Response compression (brotli when the package is installed, else gzip)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes; smaller bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
 
     class Config:
         env_file = ".env"
@@ -2,11 +2,12 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from app.db.session import get_db
+from app.db.session import get_db, async_session_maker, read_session_maker, recent_writers, request_user_id
 from app.db.models.user import User
 from app.core.security import decode_token
+from app.core.principal_cache import Principal, principal_cache
 
 # Allow missing token (auto_error=False)
 security = HTTPBearer(auto_error=False)
@@ -15,7 +16,7 @@ security = HTTPBearer(auto_error=False)
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> Principal:
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -24,7 +25,7 @@ async def get_current_user(
     
     # Decode and verify the token
     token = credentials.credentials
-    payload = decode_token(token)
+    payload = await decode_token(token)
     
     if payload is None:
         raise HTTPException(
@@ -40,22 +41,46 @@ async def get_current_user(
             detail="Invalid token payload"
         )
     
+    request_user_id.set(int(user_id))
+    principal = principal_cache.get(int(user_id))
+    if principal is not None:
+        return principal
+
     # Find user in database
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    generation = principal_cache.generation
+    result = await db.execute(
+        select(User.id, User.organization_id, User.role, User.is_active)
+        .where(User.id == int(user_id))
+    )
+    row = result.one_or_none()
     
-    if not user:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
     
-    return user
+    principal = Principal(*row)
+    principal_cache.put(principal, generation)
+    return principal
+
+
+async def get_read_db(
+    current_user: Principal = Depends(get_current_user)
+) -> AsyncIterator[AsyncSession]:
+    """Session for read-only routes, on the read replica if one is configured."""
+    if recent_writers.wrote_recently(current_user.id):
+        session_maker = async_session_maker
+    else:
+        session_maker = read_session_maker
+
+    async with session_maker() as session:
+        yield session
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -66,8 +91,8 @@ async def get_current_active_user(
 
 def require_roles(allowed_roles: list[str]):
     async def role_checker(
-        current_user: User = Depends(get_current_active_user)
-    ) -> User:
+        current_user: Principal = Depends(get_current_active_user)
+    ) -> Principal:
         # Relax role check if we are in this permissive mode? 
         # Or enforce if user has role.
         if current_user.role not in allowed_roles:
@@ -0,0 +1,64 @@
+"""
+Strong ETags and conditional GET for read endpoints
+Tags are derived from what identifies a row's state (id, version,
+updated_at) rather than from the body, so a matching If-None-Match is
+answered with 304 before anything is serialized.
+"""
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response, status
+
+# Authenticated data: browsers may keep it but must revalidate before reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Strong ETag from the values that determine a representation.
+
+    Args:
+        parts: Hashable values, e.g. organization id, query parameters and
+            (id, version, updated_at) of every row in the response
+
+    Returns:
+        Quoted ETag
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match lists ``etag`` (weak comparison, as RFC 9110 requires for it)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
+
+def conditional_get(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Tag a response, or short-circuit it if the client already has this version.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        response: The endpoint's response, which receives the ETag headers
+        etag: Tag of the representation that would be returned
+
+    Returns:
+        A 304 response to return instead of the body, or None
+    """
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+    return None
@@ -0,0 +1,71 @@
+"""
+Bounded thread pool for password hashing
+argon2 is CPU and memory heavy (tens of ms, 64 MiB per hash by default);
+running it here keeps the event loop free and caps concurrent hashes.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from app.core.metrics import LatencyHistogram
+
+T = TypeVar("T")
+
+
+class HashPoolBusyError(RuntimeError):
+    """Raised when too many hashes are already queued."""
+
+
+class PasswordHashPool:
+    """
+    Runs blocking hash calls on ``workers`` threads.
+
+    argon2-cffi releases the GIL while hashing, so threads give real
+    parallelism without the pickling and startup cost of a process pool.
+    At most ``max_queue`` calls wait for a free thread; beyond that callers
+    get HashPoolBusyError instead of piling up behind a slow queue.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 32):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.rejected = 0
+        # Time from submission to result, including queueing
+        self.latency = LatencyHistogram()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def queued(self) -> int:
+        return max(self.in_flight - self.workers, 0)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HashPoolBusyError("Password hashing queue is full")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.latency.observe((time.perf_counter() - started) * 1000)
+
+    def shutdown(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "latency": self.latency.snapshot(),
+        }
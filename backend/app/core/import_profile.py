@@ -0,0 +1,91 @@
+"""
+Import-time profiler for startup diagnostics
+Times every module executed while installed, like ``python -X importtime``,
+so the slowest imports can be logged when the application boots.
+"""
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Meta path finder that wraps each found loader's exec_module with a timer.
+
+    It never loads anything itself: the remaining finders locate the module
+    and only the returned loader instance is instrumented, so module specs
+    and loader types are unchanged.
+    """
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, Tuple[float, float]] = {}  # module -> (self ms, cumulative ms)
+        self._stack = threading.local()
+        self._started: Optional[float] = None
+        self.total_ms = 0.0
+
+    @property
+    def installed(self) -> bool:
+        return self in sys.meta_path
+
+    def install(self) -> None:
+        if not self.installed:
+            sys.meta_path.insert(0, self)
+            self._started = time.perf_counter()
+
+    def uninstall(self) -> None:
+        if self.installed:
+            sys.meta_path.remove(self)
+            self.total_ms = (time.perf_counter() - self._started) * 1000  # type: ignore[operator]
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            # Builtin and frozen importers are classes shared by every module
+            if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+                loader.exec_module = self._timed(fullname, loader.exec_module)  # type: ignore[method-assign]
+            return spec
+        return None
+
+    def _timed(self, name: str, exec_module: Callable[[ModuleType], None]) -> Callable[[ModuleType], None]:
+        def exec_module_timed(module: ModuleType) -> None:
+            stack: List[float] = self._stack.__dict__.setdefault("children", [])
+            stack.append(0.0)
+            started = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self.timings[name] = (elapsed - children, elapsed)
+        return exec_module_timed
+
+    def slowest(self, limit: int = 10, by: str = "cumulative") -> List[Dict[str, Any]]:
+        """
+        Modules with the highest import time.
+
+        Args:
+            limit: Number of modules to return
+            by: "cumulative" (including the module's own imports) or "self"
+
+        Returns:
+            List of {"module", "self_ms", "cumulative_ms"}, slowest first
+        """
+        column = 1 if by == "cumulative" else 0
+        ranked = sorted(self.timings.items(), key=lambda item: item[1][column], reverse=True)[:limit]
+        return [
+            {"module": name, "self_ms": round(own, 1), "cumulative_ms": round(cumulative, 1)}
+            for name, (own, cumulative) in ranked
+        ]
+
+
+import_profiler = ImportProfiler()
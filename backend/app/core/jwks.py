@@ -0,0 +1,107 @@
+"""
+Async JWKS cache for verifying Neon Auth (RS256) tokens
+Keys are indexed by kid and refreshed in the background after a TTL.
+Fetches are single-flight, failures back off exponentially, and an
+unknown kid forces at most one refetch per refresh interval.
+"""
+import asyncio
+import time
+from typing import Dict, Optional
+
+from app.core.logging_config import get_logger, log_auth
+
+logger = get_logger("core.jwks")
+
+
+def jwks_url(auth_url: str) -> str:
+    """Append .well-known/jwks.json if not present"""
+    if auth_url.endswith("jwks.json"):
+        return auth_url
+    return auth_url.rstrip("/") + "/.well-known/jwks.json"
+
+
+class JWKSCache:
+    """Neon Auth signing keys, indexed by kid."""
+
+    def __init__(
+        self,
+        url: str,
+        ttl: float = 300.0,
+        min_refresh_interval: float = 30.0,
+        max_backoff: float = 300.0,
+        timeout: float = 5.0
+    ):
+        self.url = url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        self._keys: Dict[str, dict] = {}
+        self._fetched_at = 0.0
+        self._last_attempt = float("-inf")
+        self._failures = 0
+        self._retry_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._fetched_at > self.ttl
+
+    def _backing_off(self) -> bool:
+        return time.monotonic() < self._retry_at
+
+    async def get_key(self, kid: Optional[str]) -> Optional[dict]:
+        """
+        Return the JWK for ``kid``, fetching the key set if needed.
+
+        Stale keys are served while a background refresh runs. An unknown
+        kid (e.g. after key rotation) triggers a synchronous refetch, at most
+        once per ``min_refresh_interval``.
+        """
+        if not kid:
+            return None
+
+        if not self._keys:
+            await self.refresh()
+        elif self.is_stale:
+            self._start_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_attempt >= self.min_refresh_interval:
+            await self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    def _start_refresh(self) -> asyncio.Task:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._fetch())
+        return self._inflight
+
+    async def refresh(self) -> None:
+        """Fetch the key set; concurrent callers share a single request."""
+        if self._backing_off():
+            return
+        # Shielded so a cancelled request doesn't abort the fetch other callers wait on
+        await asyncio.shield(self._start_refresh())
+
+    async def _fetch(self) -> None:
+        import httpx
+
+        self._last_attempt = time.monotonic()
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                resp = await client.get(self.url)
+            resp.raise_for_status()
+            keys = {k["kid"]: k for k in resp.json()["keys"] if "kid" in k}
+        except Exception as e:
+            self._failures += 1
+            backoff = min(self.max_backoff, 2 ** (self._failures - 1))
+            self._retry_at = time.monotonic() + backoff
+            log_auth(logger, f"⚠️ JWKS fetch failed, retrying in {backoff:.0f}s: {str(e)}", level="warning")
+            return
+
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        self._failures = 0
+        self._retry_at = 0.0
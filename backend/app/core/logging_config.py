@@ -2,10 +2,13 @@
 Logging configuration for ComplianceCheckpoint Backend
 Provides structured logging with status indicators
 """
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 import json
 
@@ -38,8 +41,8 @@ class ColoredFormatter(logging.Formatter):
     }
     
     def format(self, record: logging.LogRecord) -> str:
-        # Add timestamp
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        # Add timestamp (of the call, not of formatting, which happens later on the listener thread)
+        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
         
         # Get color for level
         color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
@@ -69,12 +72,18 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+# Standard LogRecord attributes; anything else on a record came from `extra`
+RESERVED_ATTRS = frozenset(
+    logging.LogRecord("", logging.NOTSET, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "status"}
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging"""
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -90,41 +99,96 @@ class JSONFormatter(logging.Formatter):
         
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename', 'funcName',
-                          'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                          'pathname', 'process', 'processName', 'relativeCreated',
-                          'stack_info', 'exc_info', 'exc_text', 'thread', 'threadName',
-                          'status', 'message']:
+            if key not in RESERVED_ATTRS:
                 log_data[key] = value
         
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return json.dumps(log_data, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue that drops records instead of blocking.
+
+    Only the message is merged on the calling thread; formatting (including
+    tracebacks) is left to the listener's handlers.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.log_queue = log_queue  # self.queue is typed as any queue-like object
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        # Args may be mutated by the caller before the listener gets to them
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_stats() -> dict:
+    """Queue depth and number of records dropped because the queue was full."""
+    if _queue_handler is None:
+        return {"queued": 0, "dropped": 0}
+    return {"queued": _queue_handler.log_queue.qsize(), "dropped": _queue_handler.dropped}
 
 
 def setup_logging(
     level: str = "INFO",
     json_format: bool = False,
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    queue_size: int = 10_000
 ) -> logging.Logger:
     """
     Setup application logging with colored console output and optional file logging
+
+    Loggers only put records on a bounded queue; a background thread formats
+    them and writes to the console and file. Records that arrive while the
+    queue is full are dropped and counted (see logging_stats).
     
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: Use JSON format for logs
         log_file: Optional path to log file
+        max_bytes: Rotate the log file once it reaches this size
+        backup_count: Number of rotated log files to keep
+        queue_size: Maximum number of records waiting to be written
     
     Returns:
         Configured logger instance
     """
+    global _queue_handler, _listener
+
     # Get root logger for the app
     logger = logging.getLogger("compliance_checkpoint")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
     
     # Remove existing handlers
+    stop_logging()
     logger.handlers.clear()
     
     # Console handler
@@ -136,18 +200,26 @@ def setup_logging(
     else:
         console_handler.setFormatter(ColoredFormatter())
     
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
     
     # File handler (optional)
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(JSONFormatter())  # Always use JSON for file logs
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    _listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(_queue_handler)
     
     return logger
 
 
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a child logger with the given name"""
     return logging.getLogger(f"compliance_checkpoint.{name}")
@@ -0,0 +1,55 @@
+"""
+In-process metrics
+Cheap fixed-bucket histograms for timing hot paths; no external exporter.
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+# Upper bounds in milliseconds; the last bucket catches everything slower
+DEFAULT_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Counts observations into fixed latency buckets (milliseconds)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect_left(self.buckets, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Upper bound of the bucket containing the ``p``-th percentile.
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Bucket bound in ms, ``inf`` if it falls in the overflow bucket,
+            or None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = self.count * p / 100
+        seen = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, object]:
+        labels = [f"le_{b:g}" for b in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
@@ -0,0 +1,324 @@
+"""
+Keyset pagination and field projection for list endpoints
+Pages continue from an opaque cursor holding the last row's sort key, so
+every page costs one index range scan however deep it is. Responses stay
+plain JSON arrays; the next cursor is sent in the X-Next-Cursor header.
+Paging is opt-in: without ?limit= or ?cursor= the whole list is returned.
+"""
+import base64
+import binascii
+import bisect
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+from app.core.config import settings
+from app.core.etag import compute_etag, etag_headers, etag_matches, not_modified
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    One column of a keyset ordering.
+
+    All keys of an ordering share one direction and the last must be unique
+    (the id). Only the first key may be nullable; its NULLs sort last.
+    """
+    column: Any  # mapped attribute, e.g. Evidence.created_at
+    descending: bool = False
+    nullable: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.column.key
+
+    def order_by(self) -> ColumnElement:
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nullslast() if self.nullable else clause
+
+
+@dataclass
+class PageRequest:
+    limit: Optional[int]  # None: the whole list
+    cursor: Optional[str]
+    fields: Optional[Tuple[str, ...]]
+    request: Request
+    response: Response
+
+
+def page_request(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(
+        None, ge=1, le=settings.PAGINATION_MAX_LIMIT,
+        description="Maximum number of items to return; all items if neither limit nor cursor is given"
+    ),
+    cursor: Optional[str] = Query(None, description=f"{NEXT_CURSOR_HEADER} header of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,status"),
+) -> PageRequest:
+    """Dependency reading the limit, cursor and fields query parameters."""
+    if limit is None and cursor:
+        limit = settings.PAGINATION_DEFAULT_LIMIT
+    selected = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip())) if fields else None
+    return PageRequest(limit=limit, cursor=cursor, fields=selected or None, request=request, response=response)
+
+
+def encode_cursor(row: Any, order: Sequence[SortKey]) -> str:
+    values = [_value(row, key.name) for key in order]
+    raw = json.dumps(jsonable_encoder(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, order: Sequence[SortKey]) -> List[Any]:
+    """
+    Decode a cursor back into typed sort key values.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or from another ordering
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(order):
+            raise ValueError("wrong number of values")
+        return [_parse(key, value) for key, value in zip(order, values)]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _parse(key: SortKey, value: Any) -> Any:
+    if value is None:
+        if not key.nullable:
+            raise ValueError(f"{key.name} cannot be null")
+        return None
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if not isinstance(value, python_type):
+        raise ValueError(f"{key.name} must be {python_type.__name__}")
+    return value
+
+
+def _value(row: Any, name: str) -> Any:
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def keyset_after(order: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """Rows strictly after ``values``, as one row-value comparison the index can range-scan."""
+    if len({key.descending for key in order}) != 1:
+        raise ValueError("Keyset sort keys must share one direction")
+    columns, bound = tuple_(*(key.column for key in order)), tuple_(*values)
+    return columns < bound if order[0].descending else columns > bound
+
+
+def validate_fields(schema: Type[BaseModel], fields: Sequence[str]) -> None:
+    """
+    Raises:
+        HTTPException: 400 for fields the schema doesn't have
+    """
+    unknown = [f for f in fields if f not in schema.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+
+
+def projected_columns(
+    query: Select,
+    schema: Type[BaseModel],
+    fields: Sequence[str],
+    order: Sequence[SortKey],
+    extra: Sequence[Any] = ()
+) -> List[Any]:
+    """
+    Table columns to select for a projection, including the sort keys and
+    any ``extra`` columns (e.g. those the ETag is computed from).
+
+    Fields of the schema that aren't table columns (computed values) are
+    allowed but not selected.
+
+    Raises:
+        HTTPException: 400 for fields the schema doesn't have
+    """
+    validate_fields(schema, fields)
+    table = query.column_descriptions[0]["entity"].__table__
+    names = dict.fromkeys([
+        *(f for f in fields if f in table.c), *(key.name for key in order), *(column.key for column in extra)
+    ])
+    return [table.c[name] for name in names]
+
+
+async def _fetch(
+    db: AsyncSession,
+    query: Select,
+    order: Sequence[SortKey],
+    values: Optional[Sequence[Any]],
+    limit: Optional[int],
+    columns: Optional[List[Any]]
+) -> List[Any]:
+    if values is not None:
+        query = query.where(keyset_after(order, values))
+    if columns is not None:
+        query = query.with_only_columns(*columns)
+    query = query.order_by(*(key.order_by() for key in order))
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await db.execute(query)
+    if columns is not None:
+        return [row._asdict() for row in result.all()]
+    return list(result.scalars().all())
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    page: PageRequest,
+    order: Sequence[SortKey],
+    columns: Optional[List[Any]] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Run one page of a query in keyset order.
+
+    Args:
+        db: Database session
+        query: select() of a single model, with filters applied
+        page: Limit, cursor and fields of the request
+        order: Sort keys, ending with a unique column
+        columns: Columns to select instead of the model (see projected_columns)
+
+    Returns:
+        (rows, next cursor or None); rows are model instances, or dicts when
+        columns are given
+    """
+    values = decode_cursor(page.cursor, order) if page.cursor else None
+    # One extra row tells whether another page exists
+    wanted = page.limit + 1 if page.limit is not None else None
+
+    lead = order[0]
+    if not lead.nullable:
+        rows = await _fetch(db, query, order, values, wanted, columns)
+    else:
+        # NULLs compare as unknown, so the non-NULL range and the trailing
+        # NULLs (ordered by the remaining keys) are read as two range scans
+        rows = []
+        if values is None or values[0] is not None:
+            rows = await _fetch(db, query.where(lead.column.is_not(None)), order, values, wanted, columns)
+        if wanted is None or len(rows) < wanted:
+            null_values = values[1:] if values is not None and values[0] is None else None
+            rows += await _fetch(
+                db, query.where(lead.column.is_(None)), order[1:], null_values,
+                None if wanted is None else wanted - len(rows), columns
+            )
+
+    next_cursor = None
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = encode_cursor(rows[-1], order)
+    return rows, next_cursor
+
+
+def sort_key(order: Sequence[SortKey]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Python sort key for ``order``; sort in-memory rows with it before slice_page."""
+    return lambda row: tuple(_value(row, key.name) for key in order)
+
+
+def slice_page(rows: Sequence[Any], page: PageRequest, order: Sequence[SortKey]) -> Tuple[List[Any], Optional[str]]:
+    """
+    fetch_page over rows already in memory and sorted ascending by ``sort_key(order)``.
+
+    Cursors are interchangeable with those of fetch_page for the same order.
+    """
+    if any(key.descending or key.nullable for key in order):
+        raise ValueError("In-memory pages need ascending, non-nullable sort keys")
+
+    start = 0
+    if page.cursor:
+        values = tuple(decode_cursor(page.cursor, order))
+        start = bisect.bisect_right(rows, values, key=sort_key(order))
+
+    if page.limit is None:
+        return list(rows[start:]), None
+
+    selected = list(rows[start:start + page.limit])
+    next_cursor = None
+    if start + page.limit < len(rows):
+        next_cursor = encode_cursor(selected[-1], order)
+    return selected, next_cursor
+
+
+def page_etag(page: PageRequest, rows: List[Any], versioned_by: Sequence[Any], *extra: Any) -> str:
+    """
+    ETag of a page from the request's query and each row's id and version columns.
+
+    Args:
+        page: The page request; path and query string are part of the tag
+        rows: Rows returned by fetch_page
+        versioned_by: Columns that change whenever a row does, e.g. updated_at
+        extra: Other values the response depends on
+    """
+    names = ["id", *(column.key for column in versioned_by)]
+    versions = [tuple(_value(row, name) for name in names) for row in rows]
+    return compute_etag(page.request.url.path, page.request.url.query, versions, *extra)
+
+
+def page_response(page: PageRequest, items: List[Any], next_cursor: Optional[str], etag: Optional[str] = None) -> Any:
+    """
+    Return a page, with pagination (and ETag) headers set.
+
+    Projected items (dicts) are trimmed to the requested fields and returned
+    as a JSONResponse, bypassing the endpoint's response_model.
+    """
+    headers: Dict[str, str] = {}
+    if next_cursor:
+        next_url = page.request.url.include_query_params(cursor=next_cursor)
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    if etag:
+        headers.update(etag_headers(etag))
+
+    if page.fields is None:
+        page.response.headers.update(headers)
+        return items
+
+    content = [{field: item.get(field) for field in page.fields} for item in items]
+    return JSONResponse(content=jsonable_encoder(content), headers=headers)
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    page: PageRequest,
+    order: Sequence[SortKey],
+    schema: Type[BaseModel],
+    versioned_by: Sequence[Any] = ()
+) -> Any:
+    """
+    Fetch and return one page of a model, projected to ``fields`` if requested.
+
+    With ``versioned_by`` columns the page gets an ETag, and a matching
+    If-None-Match is answered with 304 before the rows are serialized.
+    """
+    columns = projected_columns(query, schema, page.fields, order, versioned_by) if page.fields else None
+    rows, next_cursor = await fetch_page(db, query, page, order, columns)
+
+    etag = None
+    if versioned_by:
+        etag = page_etag(page, rows, versioned_by)
+        if etag_matches(page.request, etag):
+            return not_modified(etag)
+    return page_response(page, rows, next_cursor, etag)
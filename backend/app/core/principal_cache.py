@@ -0,0 +1,122 @@
+"""
+In-process cache of authenticated principals
+Saves the users lookup on every authenticated request. Entries expire after
+a short TTL and are dropped as soon as a user's role, organization or active
+flag is changed through the ORM.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.user import User
+
+# User columns that are cached; changing any of them invalidates the entry
+PRINCIPAL_FIELDS = ("organization_id", "role", "is_active")
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The parts of a User that authorization and org scoping need."""
+    id: int
+    organization_id: Optional[int]
+    role: str
+    is_active: bool
+
+
+class PrincipalCache:
+    """
+    TTL + LRU cache of principals keyed by user id.
+
+    Not thread-safe; it is only touched from the event loop.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[Principal, float]]" = OrderedDict()
+        # Bumped on every invalidation so loads that raced with one are not cached
+        self._generation = 0
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[0]
+
+    @property
+    def generation(self) -> int:
+        """Take before loading a principal and pass to ``put``."""
+        return self._generation
+
+    def put(self, principal: Principal, generation: int) -> None:
+        """Cache ``principal`` unless an invalidation happened since ``generation``."""
+        if self.ttl <= 0 or generation != self._generation:
+            return
+
+        self._entries[principal.id] = (principal, time.monotonic() + self.ttl)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user, e.g. after deactivating them or changing their role."""
+        self._generation += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE
+)
+
+
+def _principal_changed(user: User) -> bool:
+    state = inspect(user)
+    return any(state.attrs[name].history.has_changes() for name in PRINCIPAL_FIELDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    changed: Set[int] = session.info.setdefault("principal_changes", set())
+    for obj in session.dirty:
+        if isinstance(obj, User) and _principal_changed(obj):
+            changed.add(obj.id)  # type: ignore[arg-type]
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            changed.add(obj.id)  # type: ignore[arg-type]
+
+    # Drop now so this process stops trusting the old values before commit
+    for user_id in changed:
+        principal_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    # Again after commit, in case a concurrent request re-cached the old row
+    for user_id in session.info.pop("principal_changes", ()):
+        principal_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    session.info.pop("principal_changes", None)
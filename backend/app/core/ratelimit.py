@@ -1,30 +1,65 @@
-import time
-from fastapi import Request, HTTPException, status
-from collections import defaultdict
+import math
+from fastapi import Depends, Request, HTTPException, status
 
-# Simple in-memory rate limiter
-# Key: IP address
-# Value: List of timestamps
-_requests = defaultdict(list)
+from app.core.dependencies import get_current_active_user
+from app.core.logging_config import get_logger, log_warning
+from app.core.principal_cache import Principal
+from app.ratelimit import rate_limit_backend
 
-def rate_limiter(max_requests: int = 5, window_seconds: int = 60):
-    """
-    Simple in-memory rate limiter dependency.
-    WARNING: This does not work across multiple worker processes.
-    For production with multiple workers, use Redis.
+logger = get_logger("core.ratelimit")
+
+# What a limit is counted per
+KEY_TYPES = ("ip", "user", "org")
+
+
+def route_scope(request: Request) -> str:
+    """Identify the route a request matched, e.g. ``POST /api/v1/auth/login``."""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or request.url.path
+    return f"{request.method} {path}"
+
+
+async def enforce_limit(key: str, max_requests: int, window_seconds: int) -> None:
+    try:
+        result = await rate_limit_backend.hit(key, max_requests, window_seconds)
+    except Exception as e:
+        # Fail open: an unavailable limiter shouldn't take the API down with it
+        log_warning(logger, f"⚠️ Rate limiter unavailable, allowing request: {str(e)}")
+        return
+
+    if not result.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(max(1, math.ceil(result.retry_after)))}
+        )
+
+
+def rate_limiter(max_requests: int = 5, window_seconds: int = 60, key: str = "ip"):
     """
-    async def dependency(request: Request):
-        client_ip = request.client.host if request.client else "unknown"
-        now = time.time()
+    Rate limit dependency for a single route.
 
-        # Clean old requests for this IP
-        _requests[client_ip] = [t for t in _requests[client_ip] if now - t < window_seconds]
+    Args:
+        max_requests: Requests allowed per sliding window
+        window_seconds: Window length
+        key: Count requests per client "ip", per "user" or per "org"; the
+            latter two require an authenticated user
+
+    Limits are shared between processes unless RATE_LIMIT_BACKEND=memory.
+    """
+    if key not in KEY_TYPES:
+        raise ValueError(f"Unknown rate limit key {key!r}, expected one of {KEY_TYPES}")
 
-        if len(_requests[client_ip]) >= max_requests:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many requests. Please try again later."
-            )
+    if key == "ip":
+        async def dependency(request: Request):
+            client_ip = request.client.host if request.client else "unknown"
+            await enforce_limit(f"{route_scope(request)}|ip:{client_ip}", max_requests, window_seconds)
+        return dependency
 
-        _requests[client_ip].append(now)
-    return dependency
+    async def principal_dependency(
+        request: Request,
+        current_user: Principal = Depends(get_current_active_user)
+    ):
+        identity = f"user:{current_user.id}" if key == "user" else f"org:{current_user.organization_id}"
+        await enforce_limit(f"{route_scope(request)}|{identity}", max_requests, window_seconds)
+    return principal_dependency
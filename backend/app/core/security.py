@@ -1,40 +1,47 @@
 from datetime import datetime, timedelta
 from typing import Optional
-import httpx
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.jwks import JWKSCache, jwks_url
+from app.core.hashing import PasswordHashPool
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__rounds=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM
+)
 
-# Cache for JWKS
-_jwks_cache = None
+# argon2 runs here, never on the event loop
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
 
-def get_jwks(url: str):
-    global _jwks_cache
-    if _jwks_cache:
-        return _jwks_cache
-    try:
-        # Append .well-known/jwks.json if not present
-        target_url = url
-        if not target_url.endswith("jwks.json"):
-             target_url = target_url.rstrip("/") + "/.well-known/jwks.json"
+# Neon Auth signing keys, created on first use
+_jwks_cache: Optional[JWKSCache] = None
 
-        resp = httpx.get(target_url, timeout=5.0)
-        if resp.status_code == 200:
-            _jwks_cache = resp.json()
-            return _jwks_cache
-    except Exception as e:
-        print(f"JWKS Fetch Error: {e}")
-    return None
+
+def get_jwks_cache() -> JWKSCache:
+    global _jwks_cache
+    if _jwks_cache is None:
+        _jwks_cache = JWKSCache(
+            jwks_url(settings.NEON_AUTH_URL),
+            ttl=settings.JWKS_CACHE_TTL_SECONDS,
+            min_refresh_interval=settings.JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+            max_backoff=settings.JWKS_MAX_BACKOFF_SECONDS
+        )
+    return _jwks_cache
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_pool.run(pwd_context.verify, plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await password_hash_pool.run(pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -48,30 +55,24 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def decode_token(token: str) -> Optional[dict]:
+async def decode_token(token: str) -> Optional[dict]:
     # 1. Try Neon Auth (RS256) if URL is configured
     if settings.NEON_AUTH_URL:
-        jwks = get_jwks(settings.NEON_AUTH_URL)
-        if jwks:
-            try:
-                # Extract kid from header
-                header = jwt.get_unverified_header(token)
-                rsa_key = {}
-                for key in jwks["keys"]:
-                    if key["kid"] == header.get("kid"):
-                        rsa_key = key
-                        break
+        try:
+            # Extract kid from header
+            header = jwt.get_unverified_header(token)
+            rsa_key = await get_jwks_cache().get_key(header.get("kid"))
 
-                if rsa_key:
-                    # Verify signature
-                    return jwt.decode(
-                        token,
-                        rsa_key,
-                        algorithms=["RS256"],
-                        options={"verify_aud": False} # Relax audience check for now
-                    )
-            except Exception:
-                pass # Try next method
+            if rsa_key:
+                # Verify signature
+                return jwt.decode(
+                    token,
+                    rsa_key,
+                    algorithms=["RS256"],
+                    options={"verify_aud": False} # Relax audience check for now
+                )
+        except Exception:
+            pass # Try next method
 
     # 2. Fallback to Local Auth (HS256)
     try:
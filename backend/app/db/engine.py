@@ -0,0 +1,159 @@
+"""
+Async engine construction from Settings
+DB_PROFILE selects defaults for local development, a direct production
+connection, or a transaction-pooling proxy (PgBouncer, Neon's -pooler host).
+"""
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.metrics import LatencyHistogram
+
+PROFILES = ("dev", "prod", "pgbouncer")
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    echo: bool
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    statement_cache_size: int
+    statement_timeout_ms: int
+    # Transaction-pooling proxies hand each transaction a different server
+    # connection, so named prepared statements can't be reused or even
+    # relied on to exist; startup parameters are also rejected
+    transaction_pooling: bool = False
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout took, including waiting."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = LatencyHistogram()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.checkout_wait.observe((time.perf_counter() - started) * 1000)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkout_wait = self.checkout_wait  # type: ignore[attr-defined]
+        return pool
+
+
+def resolve_profile(name: Optional[str] = None) -> EngineProfile:
+    """
+    Build the engine profile from Settings.
+
+    Args:
+        name: Profile name; defaults to DB_PROFILE, or to "dev"/"prod" from ENVIRONMENT
+
+    Returns:
+        EngineProfile with any explicit DB_* overrides applied
+    """
+    name = name or settings.DB_PROFILE or ("dev" if settings.ENVIRONMENT == "development" else "prod")
+    if name not in PROFILES:
+        raise ValueError(f"Unknown DB_PROFILE {name!r}, expected one of {PROFILES}")
+
+    transaction_pooling = name == "pgbouncer"
+    return EngineProfile(
+        echo=settings.DB_ECHO if settings.DB_ECHO is not None else name == "dev",
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        statement_cache_size=(
+            settings.DB_STATEMENT_CACHE_SIZE if settings.DB_STATEMENT_CACHE_SIZE is not None
+            else 0 if transaction_pooling else 100
+        ),
+        statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
+        transaction_pooling=transaction_pooling,
+    )
+
+
+def normalize_url(database_url: str) -> Tuple[URL, Dict[str, Any]]:
+    """Switch to the asyncpg driver and turn sslmode into an SSL context asyncpg accepts."""
+    url_obj = make_url(database_url)
+
+    # Ensure asyncpg driver
+    if url_obj.drivername == "postgresql":
+        url_obj = url_obj.set(drivername="postgresql+asyncpg")
+
+    # Handle SSL for Neon/Cloud Postgres
+    connect_args: Dict[str, Any] = {}
+    if url_obj.query.get("sslmode") == "require":
+        # Create SSL context for Neon/Cloud Postgres
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = True
+        ssl_context.verify_mode = ssl.CERT_REQUIRED
+        connect_args["ssl"] = ssl_context
+
+    # Remove sslmode and channel_binding from query as asyncpg doesn't support them in options
+    query = dict(url_obj.query)
+    query.pop("sslmode", None)
+    query.pop("channel_binding", None)
+    return url_obj.set(query=query), connect_args
+
+
+def build_engine(database_url: str, profile: EngineProfile) -> AsyncEngine:
+    url_obj, connect_args = normalize_url(database_url)
+
+    if not url_obj.drivername.startswith("postgresql"):
+        # SQLite and friends (benchmarks, scripts): pool options don't apply
+        return create_async_engine(url_obj, echo=profile.echo, connect_args=connect_args)
+
+    # asyncpg's own cache plus SQLAlchemy's cache of prepared statements
+    connect_args["statement_cache_size"] = profile.statement_cache_size
+    connect_args["prepared_statement_cache_size"] = profile.statement_cache_size
+
+    if profile.transaction_pooling:
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+        # statement_timeout can't be sent as a startup parameter through the
+        # proxy; set it on the role instead (ALTER ROLE ... SET statement_timeout)
+    elif profile.statement_timeout_ms:
+        connect_args["server_settings"] = {"statement_timeout": str(profile.statement_timeout_ms)}
+
+    return create_async_engine(
+        url_obj,
+        echo=profile.echo,
+        poolclass=TimedQueuePool,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=profile.pool_timeout,
+        pool_recycle=profile.pool_recycle,
+        pool_pre_ping=profile.pool_pre_ping,
+        connect_args=connect_args
+    )
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    """Connections in use and checkout wait times of an engine's pool."""
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {"pool": type(pool).__name__}
+
+    stats: Dict[str, Any] = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+    checkout_wait = getattr(pool, "checkout_wait", None)
+    if checkout_wait is not None:
+        stats["checkout_wait"] = checkout_wait.snapshot()
+    return stats
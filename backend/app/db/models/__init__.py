@@ -6,6 +6,7 @@ from app.db.models.policy import Policy
 from app.db.models.evidence import Evidence
 from app.db.models.task import Task
 from app.db.models.audit_export import AuditExport
+from app.db.models.rate_limit import RateLimitBucket
 
 __all__ = [
     "User",
@@ -15,5 +16,6 @@ __all__ = [
     "Policy",
     "Evidence",
     "Task",
-    "AuditExport"
+    "AuditExport",
+    "RateLimitBucket"
 ]
\ No newline at end of file
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 
 
 class AuditExport(Base, TimestampMixin):
     __tablename__ = "audit_exports"
+    __table_args__ = (
+        Index("ix_audit_exports_org_created", "organization_id", "created_at"),
+        # Export job claiming (app/services/export_jobs.py)
+        Index("ix_audit_exports_status_created", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -15,6 +20,11 @@ class AuditExport(Base, TimestampMixin):
     status = Column(String(20), default="Pending")  # Pending, Processing, Ready, Failed
     generated_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Background job bookkeeping
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    available_at = Column(DateTime(timezone=True), nullable=True)  # Earliest retry time
+    last_error = Column(Text, nullable=True)
+
     # Relationships
     organization = relationship("Organization", back_populates="audit_exports")
     framework = relationship("Framework", back_populates="audit_exports")
\ No newline at end of file
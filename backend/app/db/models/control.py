@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 
 
 class Control(Base, TimestampMixin):
     __tablename__ = "controls"
+    __table_args__ = (
+        Index("uq_controls_framework_code", "framework_id", "control_code", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     framework_id = Column(Integer, ForeignKey("frameworks.id"), nullable=False)
@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 
 
 class Evidence(Base, TimestampMixin):
     __tablename__ = "evidence"
+    __table_args__ = (
+        # Evidence lists, newest first, optionally per control
+        Index("ix_evidence_org_control_created", "organization_id", "control_id", "created_at"),
+        Index("ix_evidence_org_created", "organization_id", "created_at"),
+        # Latest version of a file on upload
+        Index("ix_evidence_org_control_file_version", "organization_id", "control_id", "file_name", "version"),
+        # Blob reference counting on delete
+        Index("ix_evidence_org_file_url", "organization_id", "file_url"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     control_id = Column(Integer, ForeignKey("controls.id"), nullable=False)
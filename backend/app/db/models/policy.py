@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 
 
 class Policy(Base, TimestampMixin):
     __tablename__ = "policies"
+    __table_args__ = (
+        Index("ix_policies_org_created", "organization_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, BigInteger, Float
+from app.db.base import Base
+
+
+class RateLimitBucket(Base):
+    """Sliding window counters shared by every API process."""
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    window = Column(BigInteger, nullable=False)  # floor(epoch seconds / window length)
+    current = Column(Integer, nullable=False, default=0)  # Requests in `window`
+    previous = Column(Integer, nullable=False, default=0)  # Requests in `window - 1`
+    expires_at = Column(Float, nullable=False, index=True)  # Epoch seconds after which the row says nothing
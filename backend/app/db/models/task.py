@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 
 
 class Task(Base, TimestampMixin):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_org_status", "organization_id", "status"),
+        # Per-control task counts (control status) and control filters
+        Index("ix_tasks_org_control", "organization_id", "control_id"),
+        # "My tasks", soonest due first
+        Index("ix_tasks_owner_due", "owner_id", "due_date"),
+        # Task list pages in (due_date, id) keyset order
+        Index("ix_tasks_org_due", "organization_id", "due_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     control_id = Column(Integer, ForeignKey("controls.id"), nullable=False)
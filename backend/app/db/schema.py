@@ -0,0 +1,101 @@
+"""
+Startup checks against the database
+Verifies the schema is at the Alembic head instead of reflecting every
+table with create_all, and pre-opens pooled connections.
+"""
+import asyncio
+from pathlib import Path
+from typing import Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+class SchemaVersionError(RuntimeError):
+    """The database is not migrated to the revision this code expects."""
+
+
+def expected_heads() -> Set[str]:
+    """Head revision(s) of the migrations shipped with this code."""
+    # Alembic takes longer to import than the check takes to run; load it only here
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory(str(ALEMBIC_DIR)).get_heads())
+
+
+async def _current_revisions(engine: AsyncEngine) -> Set[str]:
+    async with engine.connect() as conn:
+        try:
+            rows = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalars().all()
+        except Exception as e:
+            raise SchemaVersionError(
+                "Database has no alembic_version table; run `alembic upgrade head` "
+                "(or `alembic stamp 0001` first for a database created by create_all)"
+            ) from e
+    return set(rows)
+
+
+async def verify_schema_version(engine: AsyncEngine) -> str:
+    """
+    Check the database's Alembic revision with a single query.
+
+    Args:
+        engine: Engine of the primary database
+
+    Returns:
+        The current revision
+
+    Raises:
+        SchemaVersionError: If the database is unversioned or not at head
+    """
+    # Reading the migration scripts runs in a thread, overlapping the query
+    current, heads = await asyncio.gather(_current_revisions(engine), asyncio.to_thread(expected_heads))
+    if current != heads:
+        raise SchemaVersionError(
+            f"Database schema is at {sorted(current) or 'no revision'}, expected {sorted(heads)}; "
+            "run `alembic upgrade head`"
+        )
+    return ", ".join(sorted(current))
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open up to ``connections`` pooled connections concurrently and return them to the pool.
+
+    Returns:
+        Number of connections opened
+    """
+    if connections <= 0:
+        return 0
+
+    all_attempted = asyncio.Event()
+    attempted = opened = 0
+
+    def attempt_done() -> None:
+        nonlocal attempted
+        attempted += 1
+        if attempted == connections:
+            all_attempted.set()
+
+    async def hold() -> None:
+        nonlocal opened
+        counted = False
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                opened += 1
+                counted = True
+                attempt_done()
+                # Keep it checked out until all are open so each task gets its own connection
+                await all_attempted.wait()
+        finally:
+            if not counted:
+                attempt_done()
+
+    results = await asyncio.gather(*(hold() for _ in range(connections)), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors and not opened:
+        raise errors[0]
+    return opened
@@ -1,38 +1,16 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 from app.core.config import settings
-import ssl
-
-# Handle async driver and sslmode
-from sqlalchemy.engine.url import make_url
-
-db_url = settings.DATABASE_URL
-url_obj = make_url(db_url)
-
-# Ensure asyncpg driver
-if url_obj.drivername == "postgresql":
-    url_obj = url_obj.set(drivername="postgresql+asyncpg")
-
-# Handle SSL for Neon/Cloud Postgres
-connect_args = {}
-if url_obj.query.get("sslmode") == "require":
-    # Create SSL context for Neon/Cloud Postgres
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = True
-    ssl_context.verify_mode = ssl.CERT_REQUIRED
-    connect_args["ssl"] = ssl_context
-
-# Remove sslmode and channel_binding from query as asyncpg doesn't support them in options
-query = dict(url_obj.query)
-query.pop("sslmode", None)
-query.pop("channel_binding", None)
-url_obj = url_obj.set(query=query)
-
-engine = create_async_engine(
-    url_obj,
-    echo=True,
-    future=True,
-    connect_args=connect_args
-)
+from app.db.engine import build_engine, resolve_profile
+
+engine_profile = resolve_profile()
+engine = build_engine(settings.DATABASE_URL, engine_profile)
 
 async_session_maker = async_sessionmaker(
     engine,
@@ -40,12 +18,83 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Read replica; without one, reads go to the primary
+if settings.DATABASE_READ_URL:
+    read_engine = build_engine(settings.DATABASE_READ_URL, engine_profile)
+    read_session_maker = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+else:
+    read_engine = engine
+    read_session_maker = async_session_maker
+
+# Authenticated user of the current request, set by get_current_user
+request_user_id: ContextVar[Optional[int]] = ContextVar("request_user_id", default=None)
+
+
+class RecentWriters:
+    """
+    Users who committed a write in the last ``window`` seconds.
+
+    Their reads stay on the primary so they see their own changes despite
+    replica lag. Tracked per process, for at most ``max_users`` users: a
+    read served by another worker process can still hit the replica, so
+    routes that must see rows written elsewhere read the primary directly.
+    """
+
+    def __init__(self, window: float, max_users: int = 10_000):
+        self.window = window
+        self.max_users = max_users
+        self._until: "OrderedDict[int, float]" = OrderedDict()
+
+    def mark(self, user_id: int) -> None:
+        if self.window <= 0:
+            return
+        self._until[user_id] = time.monotonic() + self.window
+        self._until.move_to_end(user_id)
+        while len(self._until) > self.max_users:
+            self._until.popitem(last=False)
+
+    def wrote_recently(self, user_id: int) -> bool:
+        until = self._until.get(user_id)
+        if until is None:
+            return False
+        if until < time.monotonic():
+            del self._until[user_id]
+            return False
+        return True
+
+
+# Longer than typical replica lag, short enough that writers soon read the replica again
+DEFAULT_READ_YOUR_WRITES_SECONDS = 5.0
+
+
+def read_your_writes_window() -> float:
+    if settings.READ_YOUR_WRITES_SECONDS is not None:
+        return settings.READ_YOUR_WRITES_SECONDS
+    return DEFAULT_READ_YOUR_WRITES_SECONDS if settings.DATABASE_READ_URL else 0.0
+
+
+recent_writers = RecentWriters(read_your_writes_window())
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_flush(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_bulk_write(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["wrote"] = True
+
 
 async def get_db():
     async with async_session_maker() as session:
         try:
             yield session
             await session.commit()
+            user_id = request_user_id.get()
+            if session.info.pop("wrote", False) and user_id is not None:
+                recent_writers.mark(user_id)
         except Exception:
             await session.rollback()
             raise
@@ -1,12 +1,34 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+import secrets
+import time
+from typing import Dict, Optional
+from contextlib import asynccontextmanager, contextmanager
 
 from app.core.config import settings
-from app.core.logging_config import setup_logging, get_logger, log_startup, log_shutdown, log_database
-from app.db.session import engine
+from app.core.import_profile import import_profiler
+
+if settings.STARTUP_PROFILE:
+    # Installed before the remaining imports so that all of them are timed
+    import_profiler.install()
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from app.core.security import get_jwks_cache, password_hash_pool
+from app.core.principal_cache import principal_cache
+from app.core.logging_config import setup_logging, get_logger, logging_stats, log_startup, log_shutdown, log_database, log_warning
+from app.db.session import engine, engine_profile, read_engine
+from app.db.schema import verify_schema_version, warm_pool
+from app.db.engine import pool_stats
 from app.db.base import Base
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.logging_middleware import LoggingMiddleware
+from app.services.catalog import catalog_cache
+from app.services.policy_renderer import policy_html_cache
+from app.services.export_jobs import export_workers
+from app.storage import storage
 from app.api.v1.auth import router as auth_router
 from app.api.v1.organizations import router as organizations_router
 from app.api.v1.controls import router as controls_router
@@ -16,23 +38,89 @@ from app.api.v1.tasks import router as tasks_router
 from app.api.v1.audits import router as audits_router
 
 # Setup logging
-setup_logging(level="INFO", log_file="app.log")
+setup_logging(
+    level="INFO",
+    log_file="app.log",
+    max_bytes=settings.LOG_FILE_MAX_BYTES,
+    backup_count=settings.LOG_FILE_BACKUP_COUNT,
+    queue_size=settings.LOG_QUEUE_SIZE
+)
 logger = get_logger("main")
 
 
+@contextmanager
+def startup_phase(name: str, timings: Dict[str, float]):
+    started = time.perf_counter()
+    yield
+    timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    log_startup(logger, f"⏱️ {name}: {timings[name]:.0f}ms")
+
+
+async def prepare_database(timings: Dict[str, float]) -> None:
+    mode = settings.STARTUP_SCHEMA_CHECK
+    if mode == "create_all":
+        with startup_phase("create_all", timings):
+            async with engine.begin() as conn:
+                log_database(logger, "🗄️ Connecting to database...")
+                await conn.run_sync(Base.metadata.create_all)
+                log_database(logger, "✅ Database tables created/verified successfully")
+    elif mode == "verify":
+        with startup_phase("schema check", timings):
+            revision = await verify_schema_version(engine)
+            log_database(logger, f"✅ Database schema at revision {revision}")
+
+    warmup = min(settings.DB_POOL_WARMUP_CONNECTIONS, engine_profile.pool_size)
+    if warmup > 0:
+        with startup_phase("pool warm-up", timings):
+            opened = await warm_pool(engine, warmup)
+            if read_engine is not engine:
+                opened += await warm_pool(read_engine, warmup)
+            log_database(logger, f"🔌 Opened {opened} database connections")
+
+
+def log_import_profile() -> None:
+    log_startup(logger, f"📦 Imports took {import_profiler.total_ms:.0f}ms")
+    for by in ("cumulative", "self"):
+        slowest = import_profiler.slowest(by=by)
+        log_startup(logger, f"📦 Slowest imports ({by} time):", imports=slowest)
+        for entry in slowest:
+            log_startup(logger, f"   {entry[by + '_ms']:>8.1f}ms  {entry['module']}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    started = time.perf_counter()
+    timings: Dict[str, float] = {}
+    app.state.ready = False
     log_startup(logger, "🚀 ComplianceCheckpoint API starting up...")
     log_startup(logger, f"📍 Environment: {settings.ENVIRONMENT if hasattr(settings, 'ENVIRONMENT') else 'development'}")
+    if settings.STARTUP_PROFILE:
+        log_import_profile()
     
     try:
-        async with engine.begin() as conn:
-            log_database(logger, "🗄️ Connecting to database...")
-            await conn.run_sync(Base.metadata.create_all)
-            log_database(logger, "✅ Database tables created/verified successfully")
+        await prepare_database(timings)
+
+        with startup_phase("catalog load", timings):
+            try:
+                catalog = await catalog_cache.get()
+                log_database(logger, f"📚 Cached {len(catalog.frameworks)} frameworks and {len(catalog.controls)} controls")
+            except Exception as e:
+                # Not fatal: the first request that needs the catalog loads it
+                log_warning(logger, f"⚠️ Catalog not loaded at startup: {str(e)}")
+
+        with startup_phase("export workers", timings):
+            await export_workers.start()
+            log_startup(logger, f"⚙️ Started {export_workers.concurrency} audit export workers")
+
+        if settings.NEON_AUTH_URL:
+            # Fetch signing keys now rather than on the first authenticated request
+            with startup_phase("JWKS fetch", timings):
+                await get_jwks_cache().refresh()
         
-        log_startup(logger, "✅ Application startup complete!")
+        app.state.startup_timings = timings
+        app.state.ready = True
+        log_startup(logger, f"✅ Application startup complete in {(time.perf_counter() - started) * 1000:.0f}ms!", startup_timings=timings)
         log_startup(logger, f"🌐 API Documentation: http://localhost:8000/docs")
         log_startup(logger, f"🔗 Frontend URL: {settings.FRONTEND_URL}")
         
@@ -43,9 +131,18 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    app.state.ready = False
     log_shutdown(logger, "🛑 Application shutting down...")
+    await export_workers.stop()
+    password_hash_pool.shutdown()
+    await storage.close()
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
     log_shutdown(logger, "✅ Database connections closed")
+    dropped = logging_stats()["dropped"]
+    if dropped:
+        log_warning(logger, f"⚠️ {dropped} log records were dropped because the log queue was full")
     log_shutdown(logger, "👋 Goodbye!")
 
 
@@ -56,8 +153,16 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Compression sits innermost, so the logging middleware sees the final response
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
 # Add logging middleware (must be added before CORS)
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(LoggingMiddleware, success_sample_rate=settings.LOG_SUCCESS_SAMPLE_RATE)
 
 # CORS - Restricted origins
 cors_origins = [settings.FRONTEND_URL]
@@ -73,6 +178,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "Link", "ETag"],
 )
 
 # Include routers
@@ -103,4 +209,55 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "ComplianceCheckpoint API"}
\ No newline at end of file
+    return {"status": "healthy", "service": "ComplianceCheckpoint API"}
+
+
+@app.get("/health/ready")
+async def readiness_check(request: Request):
+    """Ready once startup finished and the database answers; for load balancer probes."""
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        log_warning(logger, f"⚠️ Readiness check failed: {str(e)}")
+        return JSONResponse(status_code=503, content={"status": "unavailable", "database": "unreachable"})
+
+    return {"status": "ready", "startup_timings_ms": request.app.state.startup_timings}
+
+
+def require_metrics_token(authorization: Optional[str] = Header(None)) -> None:
+    """Only scrapers holding METRICS_TOKEN may read /metrics; without one it is a development-only endpoint."""
+    if not settings.METRICS_TOKEN:
+        if settings.ENVIRONMENT != "development":
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+        return
+
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    stats = {
+        "database_pool": pool_stats(engine),
+        "password_hashing": password_hash_pool.stats(),
+        "principal_cache": principal_cache.stats(),
+        "catalog": catalog_cache.stats(),
+        "policy_html_cache": policy_html_cache.stats(),
+        "logging": logging_stats(),
+    }
+    if read_engine is not engine:
+        stats["read_database_pool"] = pool_stats(read_engine)
+    return stats
+
+
+# Everything app.main needs is imported by now
+import_profiler.uninstall()
\ No newline at end of file
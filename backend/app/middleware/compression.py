@@ -0,0 +1,193 @@
+"""
+Response compression middleware
+Compresses text and JSON responses with brotli (when installed) or gzip,
+keeping ETags strong by giving each encoding its own tag.
+"""
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore[import-untyped]
+except ImportError:  # optional: without it only gzip is offered
+    brotli = None
+
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+})
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header, ignoring q=0 entries."""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q=") and quality[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(coding.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)  # 31: gzip container
+
+    def compress(self, data: bytes) -> bytes:
+        return self._brotli.process(data) if self._brotli else self._zlib.compress(data)
+
+    def finish(self) -> bytes:
+        return self._brotli.finish() if self._brotli else self._zlib.flush()
+
+
+def _tagged(etag: str, encoding: str) -> str:
+    """Strong ETag of the encoded representation: "abc" -> "abc-br"."""
+    if etag.startswith('"') and etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return etag
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing responses of at least ``minimum_size`` bytes.
+
+    Only text-like content types are compressed; responses that are already
+    encoded, partial or marked no-transform pass through. Streaming responses
+    are compressed chunk by chunk. Clients echo the encoded ETag back in
+    If-None-Match, so it is mapped to the application's tag on the way in.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(headers.get("accept-encoding", ""))
+        if_none_match, client_tags = self._untag(headers.get("if-none-match"))
+        if client_tags:
+            scope = dict(scope)
+            scope["headers"] = [(k, v) for k, v in scope["headers"] if k != b"if-none-match"]
+            scope["headers"].append((b"if-none-match", if_none_match.encode("latin-1")))
+        elif encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def compressing_send(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                response_headers = MutableHeaders(scope=message)
+                if message["status"] == 304:
+                    # Answer with the tag the client holds for its encoding
+                    etag = response_headers.get("etag")
+                    if etag in client_tags:
+                        response_headers["etag"] = client_tags[etag]
+                if encoding is None or not self._should_compress(message["status"], response_headers):
+                    passthrough = True
+                    await send(message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            # Responses without an encoding were passed through at http.response.start
+            assert start is not None and encoding is not None
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            response_headers = MutableHeaders(scope=start)
+
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    response_headers.add_vary_header("Accept-Encoding")
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                response_headers["content-encoding"] = encoding
+                response_headers.add_vary_header("Accept-Encoding")
+                if "etag" in response_headers:
+                    response_headers["etag"] = _tagged(response_headers["etag"], encoding)
+                if more_body:
+                    del response_headers["content-length"]
+                else:
+                    compressed = compressor.compress(body) + compressor.finish()
+                    response_headers["content-length"] = str(len(compressed))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                await send(start)
+
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, compressing_send)
+
+    def _should_compress(self, status_code: int, headers: MutableHeaders) -> bool:
+        return (
+            status_code not in (204, 206, 304)
+            and "content-encoding" not in headers
+            and "content-range" not in headers
+            and "no-transform" not in headers.get("cache-control", "")
+            and is_compressible(headers.get("content-type", ""))
+        )
+
+    @staticmethod
+    def _untag(if_none_match: Optional[str]) -> Tuple[str, Dict[str, str]]:
+        """
+        Strip encoding suffixes from If-None-Match tags.
+
+        Returns:
+            (rewritten header, mapping of application tag to the client's tag)
+        """
+        if not if_none_match:
+            return "", {}
+
+        client_tags: Dict[str, str] = {}
+        tags: List[str] = []
+        for tag in (t.strip() for t in if_none_match.split(",")):
+            for suffix in ('-br"', '-gzip"'):
+                if tag.endswith(suffix):
+                    untagged = tag[:-len(suffix)] + '"'
+                    client_tags[untagged] = tag
+                    tag = untagged
+                    break
+            tags.append(tag)
+        return ", ".join(tags), client_tags
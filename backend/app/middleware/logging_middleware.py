@@ -1,88 +1,106 @@
 """
 Logging middleware for FastAPI
-Logs all requests and responses with status indicators
+Logs one structured record per request with status, sizes and duration
 """
+import logging
+import random
 import time
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging_config import get_logger, LogStatus
 
 logger = get_logger("middleware.logging")
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests and responses"""
-    
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Start timer
-        start_time = time.time()
-        
-        # Get request details
-        method = request.method
-        path = request.url.path
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Log incoming request
-        logger.info(
-            f"⏳ {method} {path} - Request from {client_ip}",
-            extra={"status": LogStatus.PENDING}
-        )
-        
-        # Process request
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware to log all HTTP requests and responses.
+
+    Wraps ``receive``/``send`` instead of buffering the response, so
+    streaming responses pass through untouched. Responses below 400 are
+    logged with probability ``success_sample_rate``; errors always are.
+    """
+
+    def __init__(self, app: ASGIApp, success_sample_rate: float = 1.0):
+        self.app = app
+        self.success_sample_rate = success_sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+        bytes_in = 0
+        bytes_out = 0
+
+        async def counting_receive() -> Message:
+            nonlocal bytes_in
+            message = await receive()
+            if message["type"] == "http.request":
+                bytes_in += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            nonlocal status_code, bytes_out
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                bytes_out += len(message.get("body", b""))
+            await send(message)
+
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = (time.time() - start_time) * 1000  # ms
-            
-            # Determine status based on response code
-            status_code = response.status_code
-            if status_code >= 500:
-                status = LogStatus.ERROR
-                log_level = "error"
-            elif status_code >= 400:
-                status = LogStatus.WARNING
-                log_level = "warning"
-            else:
-                status = LogStatus.SUCCESS
-                log_level = "info"
-            
-            # Log response
-            getattr(logger, log_level)(
-                f"{status.value} {method} {path} - {status_code} ({duration:.2f}ms)",
-                extra={
-                    "status": status,
-                    "method": method,
-                    "path": path,
-                    "status_code": status_code,
-                    "duration_ms": round(duration, 2),
-                    "client_ip": client_ip,
-                }
-            )
-            
-            return response
-            
+            await self.app(scope, counting_receive, counting_send)
         except Exception as e:
-            # Calculate duration
-            duration = (time.time() - start_time) * 1000
-            
-            # Log error
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             logger.error(
-                f"❌ {method} {path} - Exception ({duration:.2f}ms): {str(e)}",
-                extra={
-                    "status": LogStatus.ERROR,
-                    "method": method,
-                    "path": path,
-                    "duration_ms": round(duration, 2),
-                    "client_ip": client_ip,
-                    "error": str(e),
-                },
+                "%s %s - Exception (%.2fms): %s", scope["method"], scope["path"], duration_ms, e,
+                extra=self._fields(scope, 500, bytes_in, bytes_out, duration_ms, LogStatus.ERROR, error=str(e)),
                 exc_info=True
             )
             raise
+
+        if status_code >= 500:
+            status, level = LogStatus.ERROR, logging.ERROR
+        elif status_code >= 400:
+            status, level = LogStatus.WARNING, logging.WARNING
+        else:
+            status, level = LogStatus.SUCCESS, logging.INFO
+            if self.success_sample_rate < 1.0 and random.random() >= self.success_sample_rate:
+                return
+
+        if not logger.isEnabledFor(level):
+            return
+
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        # %-style args are only formatted if a handler actually emits the record;
+        # the status emoji comes from the "status" field, not the message
+        logger.log(
+            level, "%s %s - %d (%.2fms)", scope["method"], scope["path"], status_code, duration_ms,
+            extra=self._fields(scope, status_code, bytes_in, bytes_out, duration_ms, status)
+        )
+
+    def _fields(
+        self,
+        scope: Scope,
+        status_code: int,
+        bytes_in: int,
+        bytes_out: int,
+        duration_ms: float,
+        status: LogStatus,
+        **extra
+    ) -> dict:
+        client = scope.get("client")
+        return {
+            "status": status,
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "duration_ms": round(duration_ms, 2),
+            "bytes_in": bytes_in,
+            "bytes_out": bytes_out,
+            "client_ip": client[0] if client else "unknown",
+            "sample_rate": self.success_sample_rate if status_code < 400 else 1.0,
+            **extra,
+        }
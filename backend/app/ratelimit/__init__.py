@@ -0,0 +1,23 @@
+from app.core.config import settings
+from app.db.session import async_session_maker
+from app.ratelimit.base import RateLimitBackend, RateLimitResult
+from app.ratelimit.memory import MemoryRateLimiter
+from app.ratelimit.postgres import PostgresRateLimiter
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimiter(max_keys=settings.RATE_LIMIT_MEMORY_MAX_KEYS)
+    return PostgresRateLimiter(async_session_maker)
+
+
+rate_limit_backend = create_rate_limit_backend()
+
+__all__ = [
+    "RateLimitBackend",
+    "RateLimitResult",
+    "MemoryRateLimiter",
+    "PostgresRateLimiter",
+    "create_rate_limit_backend",
+    "rate_limit_backend",
+]
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    retry_after: float = 0.0  # Seconds until a request would be allowed again
+
+
+class RateLimitBackend(ABC):
+    """
+    Counts requests per key over a sliding window.
+
+    Only allowed requests count towards the limit, so a client that retries
+    after ``retry_after`` is let in even if it kept trying meanwhile.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        """
+        Record a request for ``key`` and decide whether it is allowed.
+
+        Args:
+            key: Rate limit key, e.g. ``login:ip:10.0.0.1``
+            limit: Requests allowed per window
+            window: Window length in seconds
+
+        Returns:
+            RateLimitResult for this request
+        """
+
+    async def close(self) -> None:
+        """Release connections or background tasks."""
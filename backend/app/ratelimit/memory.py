@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict
+from typing import Callable, List
+
+from app.ratelimit.base import RateLimitBackend, RateLimitResult
+
+
+class _Ring:
+    """The last ``limit`` allowed request times of one key."""
+    __slots__ = ("times", "next")
+
+    def __init__(self, limit: int):
+        self.times: List[float] = [float("-inf")] * limit
+        self.next = 0  # Index of the oldest entry, overwritten by the next allowed request
+
+
+class MemoryRateLimiter(RateLimitBackend):
+    """
+    Exact sliding window per process.
+
+    Each key keeps a fixed-size ring of its last ``limit`` allowed requests,
+    so a check is O(1): the request is allowed if the oldest of them has left
+    the window. Only the ``max_keys`` most recently seen keys are kept.
+    Limits are per process; use it for development, tests and single-worker
+    deployments.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._rings: "OrderedDict[str, _Ring]" = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = self.clock()
+
+        ring = self._rings.get(key)
+        if ring is None or len(ring.times) != limit:
+            ring = self._rings[key] = _Ring(limit)
+        self._rings.move_to_end(key)
+        while len(self._rings) > self.max_keys:
+            self._rings.popitem(last=False)
+
+        oldest = ring.times[ring.next]
+        if now - oldest < window:
+            return RateLimitResult(allowed=False, retry_after=window - (now - oldest))
+
+        ring.times[ring.next] = now
+        ring.next = (ring.next + 1) % limit
+        return RateLimitResult(allowed=True)
+
+    def __len__(self) -> int:
+        return len(self._rings)
@@ -0,0 +1,108 @@
+import math
+import time
+from typing import Callable
+
+from sqlalchemy import case, delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.models.rate_limit import RateLimitBucket
+from app.ratelimit.base import RateLimitBackend, RateLimitResult
+
+
+def sliding_window_result(current: int, previous: int, elapsed: float, limit: int, window: float) -> RateLimitResult:
+    """
+    Decide a request from the counts of two consecutive fixed windows.
+
+    The previous window's count is weighted by how much of it still overlaps
+    the sliding window. A rejected request's ``retry_after`` is the time
+    until the estimate has room for it, assuming no other requests arrive.
+
+    Args:
+        current: Allowed requests in the current window, before this one
+        previous: Allowed requests in the previous window
+        elapsed: Fraction of the current window that has passed
+        limit: Requests allowed per window
+        window: Window length in seconds
+
+    Returns:
+        RateLimitResult for this request
+    """
+    if previous * (1 - elapsed) + current + 1 <= limit:
+        return RateLimitResult(allowed=True)
+
+    room = limit - current - 1
+    if room >= 0:
+        # Fits in this window once the previous one's weight has decayed enough
+        wait = 1 - room / previous - elapsed
+    else:
+        # Next window: this window's count becomes the decaying one
+        wait = 1 - elapsed + max(1 - (limit - 1) / current, 0)
+    return RateLimitResult(allowed=False, retry_after=wait * window)
+
+
+class PostgresRateLimiter(RateLimitBackend):
+    """
+    Sliding window shared by every process, stored in rate_limit_buckets.
+
+    Keeps request counts of the current and previous fixed window per key
+    (see ``sliding_window_result``), so an allowed request costs a single
+    upsert. A rejected request takes its increment back in the same
+    transaction.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        prune_interval: float = 300.0,
+        clock: Callable[[], float] = time.time
+    ):
+        self.session_maker = session_maker
+        self.prune_interval = prune_interval
+        self.clock = clock  # Wall clock: windows must line up across processes
+        self._next_prune = 0.0
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = self.clock()
+        window_index = math.floor(now / window)
+        elapsed = now / window - window_index
+
+        bucket = RateLimitBucket.__table__.c
+        stmt = insert(RateLimitBucket).values(
+            key=key,
+            window=window_index,
+            current=1,
+            previous=0,
+            expires_at=(window_index + 2) * window
+        )
+        upsert = stmt.on_conflict_do_update(
+            index_elements=[bucket.key],
+            set_={
+                # Every expression sees the row as it was before the update
+                "previous": case(
+                    (bucket.window == window_index, bucket.previous),
+                    (bucket.window == window_index - 1, bucket.current),
+                    else_=0
+                ),
+                "current": case(
+                    (bucket.window == window_index, bucket.current + 1),
+                    else_=1
+                ),
+                "window": window_index,
+                "expires_at": (window_index + 2) * window,
+            }
+        ).returning(bucket.current, bucket.previous)
+
+        async with self.session_maker() as db:
+            # The upsert locks the row until commit, so the decision is atomic
+            current, previous = (await db.execute(upsert)).one()
+            result = sliding_window_result(current - 1, previous, elapsed, limit, window)
+            if not result.allowed:
+                await db.execute(
+                    update(RateLimitBucket).where(RateLimitBucket.key == key).values(current=RateLimitBucket.current - 1)
+                )
+            if now >= self._next_prune:
+                self._next_prune = now + self.prune_interval
+                await db.execute(delete(RateLimitBucket).where(RateLimitBucket.expires_at < now))
+            await db.commit()
+        return result
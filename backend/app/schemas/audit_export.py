@@ -18,6 +18,7 @@ class AuditExportRead(AuditExportBase):
     download_url: Optional[str]
     status: str
     generated_at: Optional[datetime]
+    attempts: int = 0
     created_at: datetime
 
     class Config:
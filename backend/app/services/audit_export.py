@@ -0,0 +1,354 @@
+from collections import defaultdict
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, TypeVar
+import asyncio
+import io
+import os
+import json
+import tempfile
+import threading
+import zipfile
+import aiofiles
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.audit_export import AuditExport
+from app.db.models.policy import Policy
+from app.db.models.evidence import Evidence
+from app.db.models.task import Task
+from app.services.catalog import ControlRecord, FrameworkRecord, catalog_cache
+from app.services.policy_renderer import render_policy_html
+from app.utils.markdown import PLAIN
+from app.storage import StorageBackend
+
+# Storage key prefix of generated exports
+EXPORT_PREFIX = "exports"
+
+# Read size for evidence files added to ZIP exports
+ZIP_CHUNK_SIZE = 64 * 1024
+
+# Formats that are already compressed; deflating them again only burns CPU
+PRECOMPRESSED_EXTENSIONS = frozenset({
+    ".pdf", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".heic",
+    ".docx", ".xlsx", ".pptx", ".odt", ".ods",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+    ".mp3", ".mp4", ".mov", ".webm",
+})
+
+
+_Row = TypeVar("_Row", Evidence, Task)
+
+
+def index_by_control(rows: Iterable[_Row]) -> Dict[int, List[_Row]]:
+    """Group evidence or tasks by control_id in a single pass."""
+    index: Dict[int, List[_Row]] = defaultdict(list)
+    for row in rows:
+        index[row.control_id].append(row)  # type: ignore[index]
+    return dict(index)
+
+
+@dataclass
+class ExportData:
+    """Everything an audit report is built from."""
+    framework: FrameworkRecord
+    controls: Sequence[ControlRecord]
+    policies: Sequence[Policy]
+    evidence: Sequence[Evidence]
+    tasks: Sequence[Task]
+
+    # control_id -> rows, built once so report sections don't rescan evidence/tasks per control
+    evidence_by_control: Dict[int, List[Evidence]] = field(init=False, repr=False)
+    tasks_by_control: Dict[int, List[Task]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.evidence_by_control = index_by_control(self.evidence)
+        self.tasks_by_control = index_by_control(self.tasks)
+
+    def control_evidence(self, control_id: int) -> List[Evidence]:
+        return self.evidence_by_control.get(control_id, [])
+
+    def control_tasks(self, control_id: int) -> List[Task]:
+        return self.tasks_by_control.get(control_id, [])
+
+
+async def load_export_data(db: AsyncSession, org_id: int, framework_id: int) -> ExportData:
+    """Load the framework, controls, policies, evidence and tasks for an export."""
+    catalog = await catalog_cache.get()
+    framework = catalog.frameworks_by_id.get(framework_id)
+    if framework is None:
+        raise LookupError(f"Framework {framework_id} not found")
+
+    policies_result = await db.execute(
+        select(Policy).where(
+            Policy.organization_id == org_id,
+            Policy.framework_id == framework_id
+        )
+    )
+    evidence_result = await db.execute(
+        select(Evidence).where(Evidence.organization_id == org_id)
+    )
+    tasks_result = await db.execute(
+        select(Task).where(Task.organization_id == org_id)
+    )
+
+    return ExportData(
+        framework=framework,
+        controls=catalog.framework_controls(framework_id),
+        policies=policies_result.scalars().all(),
+        evidence=evidence_result.scalars().all(),
+        tasks=tasks_result.scalars().all(),
+    )
+
+
+def evidence_file(ev: Evidence) -> Tuple[str, str, Optional[int], Optional[datetime]]:
+    """Storage key, file name, size and upload time of an evidence row."""
+    return ev.file_url, ev.file_name, ev.file_size, ev.created_at  # type: ignore[return-value]
+
+
+def export_filename(org_id: int, data: ExportData) -> str:
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    return f"audit_export_{org_id}_{data.framework.name.replace(' ', '_')}_{timestamp}"
+
+
+def build_summary(data: ExportData) -> Dict[str, Any]:
+    """Build the summary.json document of a ZIP export."""
+    return {
+        "framework": data.framework.name,
+        "export_date": datetime.utcnow().isoformat(),
+        "total_controls": len(data.controls),
+        "total_policies": len(data.policies),
+        "total_evidence": len(data.evidence),
+        "controls": [
+            {
+                "code": c.control_code,
+                "title": c.title,
+                "description": c.description,
+                "evidence_count": len(data.control_evidence(c.id)),
+                "task_count": len(data.control_tasks(c.id))
+            }
+            for c in data.controls
+        ]
+    }
+
+
+def compression_for(file_name: str) -> int:
+    """Store already-compressed formats, deflate everything else."""
+    extension = os.path.splitext(file_name)[1].lower()
+    return zipfile.ZIP_STORED if extension in PRECOMPRESSED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable write target that hands written bytes back in chunks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def aiter_zip_export(
+    data: ExportData,
+    backend: StorageBackend,
+    chunk_size: int = ZIP_CHUNK_SIZE,
+    executor: Optional[Executor] = None
+) -> AsyncIterator[bytes]:
+    """
+    Build a ZIP export incrementally, yielding archive bytes as they are produced.
+
+    Evidence is streamed from storage ``chunk_size`` bytes at a time, so memory
+    use does not depend on file or archive size. Deflating runs on ``executor``
+    (the default executor if None) to keep it off the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    sink = _ChunkSink()
+
+    # An unseekable target makes zipfile write sizes in data descriptors
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        # Add summary JSON
+        zipf.writestr("summary.json", json.dumps(build_summary(data), indent=2))
+        yield sink.drain()
+
+        # Add policies as markdown
+        for policy in data.policies:
+            zipf.writestr(f"policies/{policy.title}.md", policy.content)
+            yield sink.drain()
+
+        # Add evidence files
+        for ev in data.evidence:
+            file_url, file_name, file_size, created_at = evidence_file(ev)
+            if not await backend.exists(file_url):
+                continue
+
+            zinfo = zipfile.ZipInfo(
+                f"evidence/{file_name}",
+                date_time=(created_at or datetime.utcnow()).timetuple()[:6]
+            )
+            zinfo.compress_type = compression_for(file_name)
+            zinfo.file_size = file_size or 0
+            force_zip64 = not file_size or file_size > zipfile.ZIP64_LIMIT
+
+            with zipf.open(zinfo, 'w', force_zip64=force_zip64) as dst:
+                async for chunk in backend.get_stream(file_url, chunk_size):
+                    if zinfo.compress_type == zipfile.ZIP_STORED:
+                        dst.write(chunk)
+                    else:
+                        await loop.run_in_executor(executor, dst.write, chunk)
+                    pending = sink.drain()
+                    if pending:
+                        yield pending
+            yield sink.drain()
+
+    # Central directory
+    yield sink.drain()
+
+
+class ExportCancelled(Exception):
+    """Raised in an executor thread once the export it is writing has been abandoned."""
+
+
+def _check_cancelled(cancelled: Optional[threading.Event]) -> None:
+    if cancelled is not None and cancelled.is_set():
+        raise ExportCancelled()
+
+
+def render_html_report(data: ExportData, out: TextIO, cancelled: Optional[threading.Event] = None) -> None:
+    """
+    Render the HTML report piece by piece into ``out``.
+
+    Stops with ExportCancelled before the next control or policy once
+    ``cancelled`` is set.
+    """
+    framework, controls, policies = data.framework, data.controls, data.policies
+    all_evidence = data.evidence
+
+    out.write(f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Compliance Audit Report - {framework.name}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; max-width: 900px; margin: 0 auto; padding: 20px; }}
+        h1 {{ color: #1a1a1a; border-bottom: 2px solid #3b82f6; padding-bottom: 10px; }}
+        h2 {{ color: #374151; margin-top: 30px; }}
+        h3 {{ color: #4b5563; }}
+        .control {{ background: #f9fafb; padding: 15px; margin: 10px 0; border-radius: 8px; border-left: 4px solid #3b82f6; }}
+        .control-code {{ font-weight: bold; color: #3b82f6; }}
+        .policy {{ background: #f0f9ff; padding: 15px; margin: 10px 0; border-radius: 8px; }}
+        .evidence {{ background: #f0fdf4; padding: 10px; margin: 5px 0; border-radius: 4px; }}
+        .status-completed {{ color: #059669; }}
+        .status-pending {{ color: #d97706; }}
+        .meta {{ color: #6b7280; font-size: 0.9em; }}
+    </style>
+</head>
+<body>
+    <h1>Compliance Audit Report</h1>
+    <p class="meta">Framework: {framework.name} | Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}</p>
+
+    <h2>Summary</h2>
+    <ul>
+        <li>Total Controls: {len(controls)}</li>
+        <li>Policies: {len(policies)}</li>
+        <li>Evidence Items: {len(all_evidence)}</li>
+    </ul>
+
+    <h2>Controls</h2>
+""")
+
+    for control in controls:
+        _check_cancelled(cancelled)
+        control_evidence = data.control_evidence(control.id)
+        control_tasks = data.control_tasks(control.id)
+
+        out.write(f"""
+    <div class="control">
+        <span class="control-code">{control.control_code}</span> - {control.title}
+        <p>{control.description}</p>
+        <p class="meta">Evidence: {len(control_evidence)} | Tasks: {len(control_tasks)}</p>
+""")
+
+        for ev in control_evidence:
+            out.write(f"""
+        <div class="evidence">📎 {ev.file_name} - Status: {ev.status}</div>
+""")
+
+        out.write("</div>")
+
+    out.write("""
+    <h2>Policies</h2>
+""")
+
+    for policy in policies:
+        _check_cancelled(cancelled)
+        # Exports keep markdown.markdown()'s output: no tables, fenced code or nl2br
+        policy_html = render_policy_html(policy.id, policy.version, policy.content, PLAIN)  # type: ignore
+        out.write(f"""
+    <div class="policy">
+        <h3>{policy.title}</h3>
+        <p class="meta">Status: {policy.status} | Version: {policy.version}</p>
+        {policy_html}
+    </div>
+""")
+
+    out.write("""
+</body>
+</html>
+""")
+
+
+def write_html_export(data: ExportData, export_path: str, cancelled: Optional[threading.Event] = None) -> None:
+    """Write an HTML report for PDF-style viewing. Blocking."""
+    with open(export_path, 'w') as f:
+        render_html_report(data, f, cancelled)
+
+
+async def generate_export(
+    audit_export: AuditExport,
+    data: ExportData,
+    backend: StorageBackend,
+    executor: Optional[Executor] = None
+) -> str:
+    """Generate the export file, put it in storage and return its key."""
+    filename = export_filename(audit_export.organization_id, data)  # type: ignore[arg-type]
+    fd, temp_path = tempfile.mkstemp(suffix=".part")
+    os.close(fd)
+
+    try:
+        if audit_export.export_type == "ZIP":
+            key = f"{EXPORT_PREFIX}/{filename}.zip"
+            content_type = "application/zip"
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for chunk in aiter_zip_export(data, backend, executor=executor):
+                    await f.write(chunk)
+        else:
+            key = f"{EXPORT_PREFIX}/{filename}.html"
+            content_type = "text/html"
+            cancelled = threading.Event()
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    executor, write_html_export, data, temp_path, cancelled
+                )
+            except asyncio.CancelledError:
+                # Cancelling the await doesn't stop the thread; the writer checks this between entries
+                cancelled.set()
+                raise
+
+        await backend.put_file(key, temp_path, content_type)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return key
@@ -0,0 +1,265 @@
+"""
+Process-wide cache of the framework and control catalog
+Frameworks and controls are global reference data that only change when the
+library is (re)seeded, so they are loaded once into immutable records and
+served from memory, with indexes for the lookups the API makes.
+"""
+import asyncio
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import event, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.pagination import SortKey, sort_key
+from app.db.models.control import Control
+from app.db.models.framework import Framework
+from app.db.session import async_session_maker
+
+# (framework count, latest framework change, control count, latest control change)
+CatalogVersion = Tuple[int, Optional[datetime], int, Optional[datetime]]
+
+# Order of Catalog.controls and of the paged control list
+CONTROL_ORDER = (SortKey(Control.control_code), SortKey(Control.id))
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Categories and severities repeat across controls; share one string each
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class FrameworkRecord:
+    id: int
+    name: str
+    version: Optional[str]
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class ControlRecord:
+    id: int
+    framework_id: int
+    control_code: str
+    title: str
+    description: str
+    category: Optional[str]
+    severity: Optional[str]
+    guidance_text: Optional[str]
+    evidence_guidance: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _group(controls: Tuple[ControlRecord, ...], attribute: str) -> Mapping[Any, Tuple[ControlRecord, ...]]:
+    groups: Dict[Any, List[ControlRecord]] = {}
+    for control in controls:
+        key = getattr(control, attribute)
+        if key is not None:
+            groups.setdefault(key, []).append(control)
+    return MappingProxyType({key: tuple(group) for key, group in groups.items()})
+
+
+@dataclass(frozen=True)
+class Catalog:
+    """
+    Immutable snapshot of every framework and control.
+
+    Controls are ordered by CONTROL_ORDER, the order the control list is
+    paged in; every index keeps that order.
+    """
+    version: CatalogVersion
+    frameworks: Tuple[FrameworkRecord, ...]
+    controls: Tuple[ControlRecord, ...]
+
+    frameworks_by_id: Mapping[int, FrameworkRecord] = field(init=False, repr=False)
+    by_id: Mapping[int, ControlRecord] = field(init=False, repr=False)
+    by_framework: Mapping[int, Tuple[ControlRecord, ...]] = field(init=False, repr=False)
+    by_code: Mapping[str, Tuple[ControlRecord, ...]] = field(init=False, repr=False)
+    by_category: Mapping[str, Tuple[ControlRecord, ...]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        indexes = {
+            "frameworks_by_id": MappingProxyType({f.id: f for f in self.frameworks}),
+            "by_id": MappingProxyType({c.id: c for c in self.controls}),
+            "by_framework": _group(self.controls, "framework_id"),
+            "by_code": _group(self.controls, "control_code"),
+            "by_category": _group(self.controls, "category"),
+        }
+        for name, index in indexes.items():
+            object.__setattr__(self, name, index)
+
+    def framework_controls(self, framework_id: int) -> Tuple[ControlRecord, ...]:
+        return self.by_framework.get(framework_id, ())
+
+    def filter(self, framework: Optional[str] = None, category: Optional[str] = None) -> Tuple[ControlRecord, ...]:
+        """
+        Controls matching the list endpoint's filters, in catalog order.
+
+        Args:
+            framework: Case-insensitive substring of the framework name
+            category: Case-insensitive substring of the category
+
+        Returns:
+            Matching controls
+        """
+        if not framework and not category:
+            return self.controls
+
+        selected: Optional[Set[int]] = None
+        if framework:
+            needle = framework.lower()
+            selected = {
+                control.id
+                for f in self.frameworks if needle in f.name.lower()
+                for control in self.framework_controls(f.id)
+            }
+        if category:
+            needle = category.lower()
+            in_category = {
+                control.id
+                for name, controls in self.by_category.items() if needle in name.lower()
+                for control in controls
+            }
+            selected = in_category if selected is None else selected & in_category
+        return tuple(control for control in self.controls if control.id in selected)  # type: ignore[operator]
+
+
+async def read_catalog_version(db: AsyncSession) -> CatalogVersion:
+    """The version stamp: row counts and latest updated_at of both tables."""
+    frameworks = select(func.count(Framework.id), func.max(Framework.updated_at)).subquery()
+    controls = select(func.count(Control.id), func.max(Control.updated_at)).subquery()
+    row = (await db.execute(select(frameworks.join(controls, true())))).one()
+    return tuple(row)  # type: ignore[return-value]
+
+
+async def load_catalog(db: AsyncSession, version: CatalogVersion) -> Catalog:
+    framework_rows = await db.execute(
+        select(
+            Framework.id, Framework.name, Framework.version, Framework.description,
+            Framework.created_at, Framework.updated_at
+        ).order_by(Framework.id)
+    )
+    control_rows = await db.execute(
+        select(
+            Control.id, Control.framework_id, Control.control_code, Control.title, Control.description,
+            Control.category, Control.severity, Control.guidance_text, Control.evidence_guidance,
+            Control.created_at, Control.updated_at
+        )
+    )
+    controls: List[ControlRecord] = []
+    for row in control_rows:
+        values = row._asdict()
+        values["category"] = _intern(values["category"])
+        values["severity"] = _intern(values["severity"])
+        controls.append(ControlRecord(**values))
+    # Sorted here rather than by ORDER BY: the database collation needn't agree
+    # with the Python comparisons slice_page bisects with
+    controls.sort(key=sort_key(CONTROL_ORDER))
+    return Catalog(
+        version=version,
+        frameworks=tuple(FrameworkRecord(**row._asdict()) for row in framework_rows),
+        controls=tuple(controls),
+    )
+
+
+class CatalogCache:
+    """
+    Read-through cache of the catalog.
+
+    Commits that change frameworks or controls invalidate it in this
+    process; changes made by other processes are picked up by comparing the
+    version stamp at most every ``check_interval`` seconds.
+
+    Loads always go to the primary (``session_maker``): right after an
+    invalidation a lagging replica would still serve the old catalog, and it
+    would be cached again until the next version check.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], check_interval: float = 30.0):
+        self.session_maker = session_maker
+        self.check_interval = check_interval
+        self.loads = 0
+        self._catalog: Optional[Catalog] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        # Bumped on every invalidation so a load that raced with one is re-checked
+        self._generation = 0
+        self._loaded_generation = -1
+
+    def _fresh(self) -> bool:
+        return (
+            self._catalog is not None
+            and self._loaded_generation == self._generation
+            and time.monotonic() - self._checked_at < self.check_interval
+        )
+
+    async def get(self) -> Catalog:
+        """Return the catalog, loading it from the primary if it is missing or stale."""
+        if self._fresh():
+            return self._catalog  # type: ignore[return-value]
+
+        async with self._lock:
+            if self._fresh():
+                return self._catalog  # type: ignore[return-value]
+
+            generation = self._generation
+            async with self.session_maker() as db:
+                version = await read_catalog_version(db)
+                catalog = self._catalog
+                if catalog is None or version != catalog.version or self._loaded_generation != generation:
+                    catalog = await load_catalog(db, version)
+                    self.loads += 1
+            self._catalog = catalog
+            self._loaded_generation = generation
+            self._checked_at = time.monotonic()
+            return catalog
+
+    def invalidate(self) -> None:
+        self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        catalog = self._catalog
+        return {
+            "frameworks": len(catalog.frameworks) if catalog else 0,
+            "controls": len(catalog.controls) if catalog else 0,
+            "loads": self.loads,
+        }
+
+
+catalog_cache = CatalogCache(async_session_maker, check_interval=settings.CATALOG_CHECK_SECONDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_changes(session: Session, flush_context) -> None:
+    if any(isinstance(obj, (Framework, Control)) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["catalog_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_catalog_changes(orm_execute_state) -> None:
+    if not orm_execute_state.is_select and orm_execute_state.bind_mapper is not None:
+        if orm_execute_state.bind_mapper.class_ in (Framework, Control):
+            orm_execute_state.session.info["catalog_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_catalog(session: Session) -> None:
+    if session.info.pop("catalog_changed", False):
+        catalog_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_catalog_changes(session: Session) -> None:
+    session.info.pop("catalog_changed", None)
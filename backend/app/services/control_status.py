@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.evidence import Evidence
+from app.db.models.task import Task
+from app.schemas.control import ControlWithStatus
+from app.services.catalog import ControlRecord
+
+
+@dataclass(frozen=True)
+class ControlStatus:
+    """Per-organization progress on a single control."""
+    evidence_count: int = 0
+    task_count: int = 0
+    completed_tasks: int = 0
+    in_progress_tasks: int = 0
+
+    @property
+    def completion_status(self) -> str:
+        if self.evidence_count > 0 and self.completed_tasks == self.task_count:
+            return "Completed"
+        if self.evidence_count > 0 or self.in_progress_tasks > 0:
+            return "In Progress"
+        return "Not Started"
+
+
+NOT_STARTED = ControlStatus()
+
+
+async def get_control_statuses(
+    db: AsyncSession,
+    organization_id: Optional[int],
+    control_ids: Optional[Iterable[int]] = None
+) -> Dict[int, ControlStatus]:
+    """
+    Compute evidence/task counts for every control of an organization.
+
+    Uses two grouped aggregate queries regardless of how many controls
+    there are. Controls without evidence or tasks are absent from the
+    result; look them up with ``.get(control_id, NOT_STARTED)``.
+
+    Args:
+        db: Database session
+        organization_id: Organization whose evidence and tasks are counted; None counts nothing
+        control_ids: Optional subset of controls to restrict the counts to
+
+    Returns:
+        Mapping of control id to ControlStatus
+    """
+    evidence_query: Select[Tuple[int, int]] = (
+        select(Evidence.control_id, func.count(Evidence.id))
+        .where(Evidence.organization_id == organization_id)
+        .group_by(Evidence.control_id)
+    )
+    task_query: Select[Tuple[int, int, int, int]] = (
+        select(
+            Task.control_id,
+            func.count(Task.id),
+            func.count(Task.id).filter(Task.status == "Completed"),
+            func.count(Task.id).filter(Task.status == "In Progress"),
+        )
+        .where(Task.organization_id == organization_id)
+        .group_by(Task.control_id)
+    )
+
+    if control_ids is not None:
+        ids = list(control_ids)
+        if not ids:
+            return {}
+        evidence_query = evidence_query.where(Evidence.control_id.in_(ids))
+        task_query = task_query.where(Task.control_id.in_(ids))
+
+    evidence_counts = dict((await db.execute(evidence_query)).tuples().all())
+
+    statuses: Dict[int, ControlStatus] = {}
+    for control_id, total, completed, in_progress in (await db.execute(task_query)).tuples():
+        statuses[control_id] = ControlStatus(
+            evidence_count=evidence_counts.pop(control_id, 0),
+            task_count=total,
+            completed_tasks=completed,
+            in_progress_tasks=in_progress,
+        )
+    for control_id, count in evidence_counts.items():
+        statuses[control_id] = ControlStatus(evidence_count=count)
+
+    return statuses
+
+
+def control_with_status(control: ControlRecord, control_status: ControlStatus) -> ControlWithStatus:
+    """Build the API representation of a control with its status."""
+    return ControlWithStatus(
+        id=control.id,
+        framework_id=control.framework_id,
+        control_code=control.control_code,
+        title=control.title,
+        description=control.description,
+        category=control.category,
+        severity=control.severity,
+        guidance_text=control.guidance_text,
+        evidence_guidance=control.evidence_guidance,
+        created_at=control.created_at,
+        evidence_count=control_status.evidence_count,
+        task_count=control_status.task_count,
+        completion_status=control_status.completion_status
+    )
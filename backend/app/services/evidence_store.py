@@ -0,0 +1,154 @@
+"""
+Content-addressed storage for evidence files
+Identical bytes uploaded to the same organization are stored once, under
+uploads/evidence/{org}/blobs/{sha[:2]}/{sha} in the configured storage
+backend. Evidence rows sharing a file_url are the references to a blob; it
+is removed when the last one is deleted. Adding and dropping references
+happen under a per-blob advisory lock, so the two never interleave.
+"""
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import UploadFile
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.evidence import Evidence
+from app.storage import StorageBackend, storage
+from app.utils.upload import spool_upload, DEFAULT_CHUNK_SIZE
+
+UPLOAD_PREFIX = "uploads/evidence"
+
+# Uploads are spooled here before being handed to the storage backend
+SPOOL_DIR = "uploads/tmp"
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    path: str
+    sha256: str
+    size: int
+    deduplicated: bool
+
+
+class EvidenceBlobStore:
+    def __init__(self, backend: StorageBackend, prefix: str = UPLOAD_PREFIX):
+        self.backend = backend
+        self.prefix = prefix
+
+    def blob_path(self, organization_id: int, sha256: str) -> str:
+        return f"{self.prefix}/{organization_id}/blobs/{sha256[:2]}/{sha256}"
+
+    def is_blob_path(self, path: str) -> bool:
+        return path.rsplit("/", 3)[-3:-2] == ["blobs"]
+
+    async def lock(self, db: AsyncSession, path: str) -> None:
+        """
+        Lock a blob until the transaction of ``db`` ends.
+
+        Held from the existence check until the referencing row is committed,
+        and while counting references before a removal.
+        """
+        await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(path))))
+
+    async def put_upload(
+        self,
+        db: AsyncSession,
+        file: UploadFile,
+        organization_id: int,
+        max_size: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        content_type: Optional[str] = None
+    ) -> StoredBlob:
+        """
+        Store an upload under its SHA-256, reusing an existing identical blob.
+
+        The blob stays locked until the transaction of ``db`` ends, so add the
+        evidence row in that transaction. If it doesn't commit, call
+        remove_if_orphaned for a blob that wasn't deduplicated.
+
+        Raises:
+            UploadTooLargeError: If the upload is larger than ``max_size``
+        """
+        spooled = await spool_upload(file, SPOOL_DIR, max_size, chunk_size)
+        try:
+            await self.lock(db, self.blob_path(organization_id, spooled.sha256))
+        except BaseException:
+            os.remove(spooled.path)
+            raise
+        return await self.adopt(spooled.path, organization_id, spooled.sha256, spooled.size, content_type)
+
+    async def adopt(
+        self,
+        path: str,
+        organization_id: int,
+        sha256: str,
+        size: int,
+        content_type: Optional[str] = None
+    ) -> StoredBlob:
+        """
+        Move a complete local file into the store, dropping it if the blob already exists.
+
+        Call with the blob locked (see lock).
+        """
+        key = self.blob_path(organization_id, sha256)
+        try:
+            if await self.backend.exists(key):
+                return StoredBlob(path=key, sha256=sha256, size=size, deduplicated=True)
+            await self.backend.put_file(key, path, content_type)
+            return StoredBlob(path=key, sha256=sha256, size=size, deduplicated=False)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    async def reference_count(self, db: AsyncSession, organization_id: int, path: str) -> int:
+        result = await db.execute(
+            select(func.count(Evidence.id)).where(
+                Evidence.organization_id == organization_id,
+                Evidence.file_url == path
+            )
+        )
+        return result.scalar_one()
+
+    async def is_orphaned(self, db: AsyncSession, organization_id: int, path: str) -> bool:
+        """Whether no evidence references ``path``; check with the blob locked."""
+        return await self.reference_count(db, organization_id, path) == 0
+
+    async def remove(self, path: str) -> None:
+        await self.backend.delete(path)
+
+    async def remove_if_orphaned(self, db: AsyncSession, organization_id: int, path: str) -> bool:
+        """
+        Remove a blob if no committed evidence references it.
+
+        Runs in its own transaction on ``db`` (committed here) with the blob
+        locked: a concurrent upload either commits its reference first or
+        finds the blob gone and stores it again. Call after the deleting
+        transaction has committed, so concurrent deletes can't each still
+        count the other's row.
+
+        Returns:
+            Whether the blob was removed
+        """
+        await self.lock(db, path)
+        orphaned = await self.is_orphaned(db, organization_id, path)
+        if orphaned:
+            await self.remove(path)
+        await db.commit()
+        return orphaned
+
+
+def hash_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple[str, int]:
+    """SHA-256 and size of a file on disk, read in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+evidence_store = EvidenceBlobStore(storage)
@@ -0,0 +1,297 @@
+"""
+Background generation of audit exports
+POST /audits/export only records a Pending AuditExport; workers here claim
+it, build the file off the event loop and mark it Ready or Failed
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import ColumnElement, select, update, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging_config import get_logger, log_success, log_error, log_warning
+from app.db.models.audit_export import AuditExport
+from app.db.session import async_session_maker
+from app.storage import storage
+
+logger = get_logger("services.export_jobs")
+
+# A claim goes stale this long after a job's timeout, leaving time to record
+# the outcome of a job that stopped right at the timeout
+CLAIM_GRACE_SECONDS = 60.0
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def failure_reason(error: BaseException) -> str:
+    """
+    Short reason stored on a failed export.
+
+    Exception messages can hold SQL, storage paths or S3 responses; they
+    only go to the log.
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        return "Export timed out"
+    return f"Export generation failed ({type(error).__name__})"
+
+
+class ExportJobQueue(ABC):
+    """Hands Pending audit exports to workers, marking them Processing."""
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+        self.session_maker = session_maker
+
+    @abstractmethod
+    async def enqueue(self, export_id: int) -> None:
+        """Announce a committed Pending export."""
+
+    @abstractmethod
+    async def claim(self, timeout: float) -> Optional[int]:
+        """Claim the next ready export, waiting up to ``timeout`` seconds for one."""
+
+    async def retry(self, export_id: int, delay: float, error: str) -> None:
+        """Put a failed export back to Pending, available again after ``delay`` seconds."""
+        async with self.session_maker() as db:
+            await db.execute(
+                update(AuditExport)
+                .where(AuditExport.id == export_id)
+                .values(
+                    status="Pending",
+                    last_error=error,
+                    available_at=_utcnow() + timedelta(seconds=delay)
+                )
+            )
+            await db.commit()
+
+    async def fail(self, export_id: int, error: str) -> None:
+        """Give up on an export."""
+        async with self.session_maker() as db:
+            await db.execute(
+                update(AuditExport)
+                .where(AuditExport.id == export_id)
+                .values(status="Failed", last_error=error)
+            )
+            await db.commit()
+
+
+class PostgresJobQueue(ExportJobQueue):
+    """
+    Uses the audit_exports table itself as the queue.
+
+    Workers in any process claim rows with ``FOR UPDATE SKIP LOCKED``; exports
+    stuck in Processing longer than ``stale_after`` (e.g. after a crash) are
+    claimed again.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], stale_after: float):
+        super().__init__(session_maker)
+        self.stale_after = stale_after
+        self._wakeup = asyncio.Event()
+
+    async def enqueue(self, export_id: int) -> None:
+        # The row is already committed; just wake up local workers
+        self._wakeup.set()
+
+    async def claim(self, timeout: float) -> Optional[int]:
+        export_id = await self._claim_next()
+        if export_id is None:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+        return export_id
+
+    async def _claim_next(self) -> Optional[int]:
+        now = _utcnow()
+        due: ColumnElement[bool] = and_(
+            AuditExport.status == "Pending",
+            or_(AuditExport.available_at.is_(None), AuditExport.available_at <= now)
+        )
+        stale: ColumnElement[bool] = and_(
+            AuditExport.status == "Processing",
+            AuditExport.updated_at < now - timedelta(seconds=self.stale_after)
+        )
+        ready = or_(due, stale)
+        next_id = (
+            select(AuditExport.id)
+            .where(ready)
+            .order_by(AuditExport.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        async with self.session_maker() as db:
+            result = await db.execute(
+                update(AuditExport)
+                .where(AuditExport.id == next_id)
+                .values(status="Processing", attempts=AuditExport.attempts + 1)
+                .returning(AuditExport.id)
+            )
+            export_id = result.scalar_one_or_none()
+            await db.commit()
+        return export_id
+
+
+class InMemoryJobQueue(ExportJobQueue):
+    """
+    Process-local queue for tests and single-worker development.
+
+    Export ids are only known to this process, so Pending exports are lost
+    on restart.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+        super().__init__(session_maker)
+        self._queue: asyncio.Queue[int] = asyncio.Queue()
+
+    async def enqueue(self, export_id: int) -> None:
+        self._queue.put_nowait(export_id)
+
+    async def claim(self, timeout: float) -> Optional[int]:
+        try:
+            export_id = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        async with self.session_maker() as db:
+            result = await db.execute(
+                update(AuditExport)
+                .where(AuditExport.id == export_id, AuditExport.status == "Pending")
+                .values(status="Processing", attempts=AuditExport.attempts + 1)
+                .returning(AuditExport.id)
+            )
+            claimed = result.scalar_one_or_none()
+            await db.commit()
+        return claimed
+
+    async def retry(self, export_id: int, delay: float, error: str) -> None:
+        await super().retry(export_id, delay, error)
+        asyncio.get_running_loop().call_later(delay, self._queue.put_nowait, export_id)
+
+
+class ExportWorkerPool:
+    """
+    Runs up to ``concurrency`` exports at a time.
+
+    Database and storage access stay on the event loop; rendering HTML and
+    deflating ZIP entries run on a dedicated thread pool of the same size.
+    An export running longer than ``timeout`` seconds is abandoned and
+    retried, before the queue considers its claim stale. Its thread pool work
+    stops too, though not instantly: the HTML writer finishes the control or
+    policy it is on, and a ZIP export the chunk being deflated.
+    """
+
+    def __init__(
+        self,
+        queue: ExportJobQueue,
+        concurrency: int = 2,
+        max_attempts: int = 3,
+        retry_backoff: float = 5.0,
+        poll_interval: float = 2.0,
+        timeout: float = 900.0
+    ):
+        self.queue = queue
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="audit-export")
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"audit-export-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def enqueue(self, export_id: int) -> None:
+        await self.queue.enqueue(export_id)
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                export_id = await self.queue.claim(self.poll_interval)
+                if export_id is not None:
+                    await self.run(export_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_error(logger, f"❌ Export worker error: {str(e)}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def run(self, export_id: int) -> None:
+        """Generate a claimed export, scheduling a retry on failure."""
+        # Imported on first use: the export pipeline (markdown, zipfile) isn't needed to boot
+        from app.services.audit_export import load_export_data, generate_export
+
+        attempts = 0
+        try:
+            async with self.queue.session_maker() as db:
+                audit_export = await db.get(AuditExport, export_id)
+                if audit_export is None:
+                    return
+                attempts = audit_export.attempts or 0  # type: ignore[assignment]
+
+                async def generate() -> str:
+                    data = await load_export_data(db, audit_export.organization_id, audit_export.framework_id)  # type: ignore[arg-type]
+                    return await generate_export(audit_export, data, storage, self._executor)
+
+                # Must end before the claim goes stale and another worker takes the export
+                export_key = await asyncio.wait_for(generate(), self.timeout)
+
+                audit_export.download_url = export_key  # type: ignore
+                audit_export.status = "Ready"  # type: ignore
+                audit_export.generated_at = datetime.utcnow()  # type: ignore
+                audit_export.last_error = None  # type: ignore
+                await db.commit()
+
+            log_success(logger, f"✅ Audit export {export_id} ready: {export_key}")
+
+        except Exception as e:
+            if attempts < self.max_attempts:
+                delay = self.retry_backoff * (2 ** max(attempts - 1, 0))
+                log_warning(logger, f"⚠️ Audit export {export_id} failed (attempt {attempts}), retrying in {delay:.0f}s: {e!r}")
+                await self.queue.retry(export_id, delay, failure_reason(e))
+            else:
+                log_error(logger, f"❌ Audit export {export_id} failed after {attempts} attempts: {e!r}")
+                await self.queue.fail(export_id, failure_reason(e))
+
+
+def create_export_worker_pool() -> ExportWorkerPool:
+    queue: ExportJobQueue
+    if settings.EXPORT_QUEUE_BACKEND == "memory":
+        queue = InMemoryJobQueue(async_session_maker)
+    else:
+        queue = PostgresJobQueue(
+            async_session_maker, stale_after=settings.EXPORT_JOB_TIMEOUT_SECONDS + CLAIM_GRACE_SECONDS
+        )
+
+    return ExportWorkerPool(
+        queue,
+        concurrency=settings.EXPORT_WORKERS,
+        max_attempts=settings.EXPORT_MAX_ATTEMPTS,
+        retry_backoff=settings.EXPORT_RETRY_BACKOFF_SECONDS,
+        poll_interval=settings.EXPORT_POLL_INTERVAL_SECONDS,
+        timeout=settings.EXPORT_JOB_TIMEOUT_SECONDS
+    )
+
+
+export_workers = create_export_worker_pool()
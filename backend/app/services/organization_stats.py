@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Type
+
+from sqlalchemy import select, func, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.db.base import Base
+from app.db.models.policy import Policy
+from app.db.models.evidence import Evidence
+from app.db.models.task import Task
+from app.services.catalog import catalog_cache
+
+
+@dataclass(frozen=True)
+class StatCounter:
+    """A COUNT over one table, optionally filtered and scoped to an organization."""
+    name: str
+    model: Type[Base]
+    condition: Optional[ColumnElement[bool]] = None
+    org_scoped: bool = True
+
+
+_counters: Dict[str, StatCounter] = {}
+
+
+def register_counter(
+    name: str,
+    model: Type[Base],
+    condition: Optional[ColumnElement[bool]] = None,
+    org_scoped: bool = True
+) -> StatCounter:
+    """
+    Register a counter to be computed by get_organization_counts.
+
+    Counters on the same table share one aggregate subquery, so adding a
+    counter never adds a round trip.
+
+    Args:
+        name: Key of the counter in the result
+        model: Table to count rows of
+        condition: Optional FILTER condition for the count
+        org_scoped: Restrict rows to the caller's organization
+
+    Returns:
+        The registered counter
+    """
+    counter = StatCounter(name=name, model=model, condition=condition, org_scoped=org_scoped)
+    _counters[name] = counter
+    return counter
+
+
+register_counter("total_policies", Policy)
+register_counter("approved_policies", Policy, Policy.status == "Approved")
+register_counter("total_evidence", Evidence)
+register_counter("accepted_evidence", Evidence, Evidence.status == "Accepted")
+register_counter("total_tasks", Task)
+register_counter("pending_tasks", Task, Task.status == "Pending")
+register_counter("completed_tasks", Task, Task.status == "Completed")
+
+
+async def get_organization_counts(db: AsyncSession, organization_id: Optional[int]) -> Dict[str, int]:
+    """Compute every registered counter for an organization in a single statement."""
+    by_table: Dict[tuple, List[StatCounter]] = {}
+    for counter in _counters.values():
+        by_table.setdefault((counter.model, counter.org_scoped), []).append(counter)
+
+    subqueries = []
+    for (model, org_scoped), counters in by_table.items():
+        columns = [
+            (func.count().filter(c.condition) if c.condition is not None else func.count()).label(c.name)
+            for c in counters
+        ]
+        query = select(*columns).select_from(model)
+        if org_scoped:
+            query = query.where(model.organization_id == organization_id)  # type: ignore[attr-defined]
+        subqueries.append(query.subquery())
+
+    from_clause = subqueries[0]
+    for subquery in subqueries[1:]:
+        from_clause = from_clause.join(subquery, true())  # type: ignore[assignment]
+
+    row = (await db.execute(select(from_clause))).mappings().one()
+    return {name: row[name] for name in _counters}
+
+
+async def get_organization_stats(db: AsyncSession, organization_id: Optional[int]) -> Dict[str, float]:
+    """Dashboard stats for an organization, including derived percentages."""
+    catalog = await catalog_cache.get()
+    stats: Dict[str, float] = {"total_controls": len(catalog.controls)}
+    stats.update(await get_organization_counts(db, organization_id))
+    total_tasks = stats["total_tasks"]
+    stats["completion_percentage"] = round(
+        (stats["completed_tasks"] / total_tasks * 100) if total_tasks else 0, 1
+    )
+    return stats
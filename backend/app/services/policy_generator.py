@@ -1,6 +1,12 @@
-# pylint: disable=duplicate-code
-from typing import Tuple
-from datetime import datetime
+"""
+Policy template registry
+Templates are split into literal and placeholder segments once at import,
+so rendering is a single join.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from string import Formatter
+from typing import Dict, Mapping, Tuple
 
 POLICY_TEMPLATES = {
     "information_security": {
@@ -802,28 +808,13 @@ Any exceptions require:
 }
 
 
-def generate_policy_content(policy_type: str, company_name: str) -> Tuple[str, str]:
-    """
-    Generate policy content based on policy type and company name.
-
-    Args:
-        policy_type: Type of policy to generate
-        company_name: Name of the company to insert into template
-
-    Returns:
-        Tuple of (title, content)
-    """
-    template = POLICY_TEMPLATES.get(policy_type)
-
-    if not template:
-        # Default generic policy if type not found
-        return (
-            f"{policy_type.replace('_', ' ').title()} Policy",
-            f"""# {policy_type.replace('_', ' ').title()} Policy
+GENERIC_TEMPLATE = {
+    "title": "{policy_title} Policy",
+    "content": """# {policy_title} Policy
 
 ## 1. Purpose
 
-This policy establishes guidelines for {policy_type.replace('_', ' ')} at {company_name}.
+This policy establishes guidelines for {policy_name} at {company_name}.
 
 ## 2. Scope
 
@@ -846,14 +837,87 @@ Violations of this policy may result in disciplinary action.
 This policy shall be reviewed annually.
 
 ---
-*Last Updated: {datetime.utcnow().strftime('%Y-%m-%d')}*
+*Last Updated: {date}*
 *Version: 1.0*
 """
-        )
+}
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template as literal segments with placeholder slots between them."""
+    segments: Tuple[str, ...]
+    slots: Tuple[Tuple[int, str], ...]  # (index into segments, field name)
+
+    @classmethod
+    def compile(cls, template: str) -> "CompiledTemplate":
+        """
+        Split a str.format template into segments.
+
+        Args:
+            template: Template using plain {field} placeholders
+
+        Returns:
+            CompiledTemplate that renders exactly like template.format(**values)
+        """
+        segments = []
+        slots = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if literal:
+                segments.append(literal)
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion:
+                raise ValueError(f"Unsupported placeholder {{{field_name}}} in policy template")
+            slots.append((len(segments), field_name))
+            segments.append("")
+        return cls(tuple(segments), tuple(slots))
+
+    def render(self, values: Mapping[str, str]) -> str:
+        parts = list(self.segments)
+        for index, field_name in self.slots:
+            parts[index] = values[field_name]
+        return "".join(parts)
+
+
+TEMPLATES: Dict[str, Tuple[CompiledTemplate, CompiledTemplate]] = {
+    policy_type: (CompiledTemplate.compile(template["title"]), CompiledTemplate.compile(template["content"]))
+    for policy_type, template in POLICY_TEMPLATES.items()
+}
+_GENERIC = (CompiledTemplate.compile(GENERIC_TEMPLATE["title"]), CompiledTemplate.compile(GENERIC_TEMPLATE["content"]))
+
+
+def render_policy(policy_type: str, company_name: str, date: str) -> Tuple[str, str]:
+    """
+    Render a policy template.
 
-    content = template["content"].format(
-        company_name=company_name,
-        date=datetime.utcnow().strftime('%Y-%m-%d')
-    )
+    Args:
+        policy_type: Type of policy to generate
+        company_name: Name of the company to insert into template
+        date: Date printed as the last update, YYYY-MM-DD
 
-    return (template["title"], content)
\ No newline at end of file
+    Returns:
+        Tuple of (title, content)
+    """
+    title, content = TEMPLATES.get(policy_type, _GENERIC)
+    values = {
+        "company_name": company_name,
+        "date": date,
+        "policy_title": policy_type.replace('_', ' ').title(),
+        "policy_name": policy_type.replace('_', ' '),
+    }
+    return title.render(values), content.render(values)
+
+
+def generate_policy_content(policy_type: str, company_name: str) -> Tuple[str, str]:
+    """
+    Generate policy content based on policy type and company name.
+
+    Args:
+        policy_type: Type of policy to generate
+        company_name: Name of the company to insert into template
+
+    Returns:
+        Tuple of (title, content)
+    """
+    return render_policy(policy_type, company_name, datetime.now(timezone.utc).date().isoformat())
@@ -0,0 +1,81 @@
+"""
+Cached HTML rendering of policies
+A policy's content only changes together with its version, so the HTML of
+each (policy id, version) is rendered once per markdown flavor and shared by
+the HTML endpoint and audit exports.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.markdown import FULL, render_markdown
+
+PolicyKey = Tuple[int, int, str]  # (policy id, version, markdown flavor)
+
+
+class PolicyHTMLCache:
+    """
+    LRU cache of rendered policy HTML.
+
+    Thread-safe: exports render on executor threads while requests read it
+    from the event loop.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[PolicyKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: PolicyKey) -> Optional[str]:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def put(self, key: PolicyKey, html: str) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+policy_html_cache = PolicyHTMLCache(max_size=settings.POLICY_HTML_CACHE_SIZE)
+
+
+def render_policy_html(policy_id: int, version: int, content: str, flavor: str = FULL) -> str:
+    """
+    HTML of a policy version, rendered on the first call only. Blocking.
+
+    Args:
+        policy_id: Policy id
+        version: Policy version ``content`` belongs to
+        content: Markdown content
+        flavor: Markdown extension set (app.utils.markdown FULL or PLAIN)
+
+    Returns:
+        Rendered HTML
+    """
+    html = policy_html_cache.get((policy_id, version, flavor))
+    if html is None:
+        html = cache_policy_html(policy_id, version, content, flavor)
+    return html
+
+
+def cache_policy_html(policy_id: int, version: int, content: str, flavor: str = FULL) -> str:
+    """Render a policy version and cache it, for callers that already missed the cache. Blocking."""
+    html = render_markdown(content, flavor)
+    policy_html_cache.put((policy_id, version, flavor), html)
+    return html
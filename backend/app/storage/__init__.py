@@ -0,0 +1,36 @@
+from app.core.config import settings
+from app.storage.base import StorageBackend, StorageError
+from app.storage.local import LocalStorage
+
+
+def __getattr__(name: str):
+    # The S3 backend pulls in httpx; only import it when it's used
+    if name == "S3Storage":
+        from app.storage.s3 import S3Storage
+        return S3Storage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def create_storage() -> StorageBackend:
+    if settings.STORAGE_BACKEND == "s3":
+        from app.storage.s3 import S3Storage
+        return S3Storage(
+            bucket=settings.S3_BUCKET,
+            access_key_id=settings.S3_ACCESS_KEY_ID,
+            secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            region=settings.S3_REGION,
+            endpoint_url=settings.S3_ENDPOINT_URL
+        )
+    return LocalStorage(settings.STORAGE_LOCAL_ROOT)
+
+
+storage = create_storage()
+
+__all__ = [
+    "StorageBackend",
+    "StorageError",
+    "LocalStorage",
+    "S3Storage",
+    "create_storage",
+    "storage",
+]
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class StorageError(RuntimeError):
+    """Raised when the storage backend fails for reasons other than a missing object."""
+
+
+class StorageBackend(ABC):
+    """
+    Object storage for evidence files and audit exports.
+
+    Keys are relative, '/'-separated paths such as
+    ``uploads/evidence/1/blobs/ab/ab12...``. Missing objects raise
+    FileNotFoundError.
+    """
+
+    @abstractmethod
+    async def put_file(self, key: str, path: str, content_type: Optional[str] = None) -> None:
+        """Move a complete local file into storage under ``key``; ``path`` is consumed."""
+
+    @abstractmethod
+    def get_stream(self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Stream the object's bytes in chunks."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete an object; deleting a missing object is not an error."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Whether an object is stored under ``key``."""
+
+    async def presigned_url(
+        self,
+        key: str,
+        expires_in: int,
+        filename: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Time-limited URL clients can download the object from directly.
+
+        Returns None when the backend cannot serve objects itself; callers
+        then stream the object through the API.
+        """
+        return None
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
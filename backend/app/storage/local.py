@@ -0,0 +1,45 @@
+import asyncio
+import os
+import shutil
+from typing import AsyncIterator, Optional
+
+import aiofiles
+import aiofiles.os
+
+from app.storage.base import StorageBackend, DEFAULT_CHUNK_SIZE
+
+
+class LocalStorage(StorageBackend):
+    """Stores objects as files under ``root`` on the API container's disk."""
+
+    def __init__(self, root: str = "."):
+        self.root = os.path.abspath(root)
+
+    def path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"Storage key escapes storage root: {key}")
+        return path
+
+    async def put_file(self, key: str, path: str, content_type: Optional[str] = None) -> None:
+        target = self.path(key)
+        await aiofiles.os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            # Atomic when source and target share a filesystem
+            await aiofiles.os.replace(path, target)
+        except OSError:
+            await asyncio.to_thread(shutil.move, path, target)
+
+    async def get_stream(self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        async with aiofiles.open(self.path(key), 'rb') as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+
+    async def delete(self, key: str) -> None:
+        try:
+            await aiofiles.os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    async def exists(self, key: str) -> bool:
+        return await aiofiles.os.path.exists(self.path(key))
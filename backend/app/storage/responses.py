@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi.responses import RedirectResponse, StreamingResponse
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.storage.base import StorageBackend
+
+
+async def download_response(
+    backend: StorageBackend,
+    key: str,
+    filename: str,
+    media_type: Optional[str] = None
+) -> Response:
+    """
+    Serve a stored object as a download.
+
+    Redirects to a presigned URL when the backend supports one, so API
+    workers don't proxy file bytes; otherwise streams the object.
+
+    Raises:
+        FileNotFoundError: If the object is streamed and does not exist
+    """
+    if settings.PRESIGNED_DOWNLOADS:
+        url = await backend.presigned_url(key, settings.PRESIGNED_URL_EXPIRE_SECONDS, filename=filename)
+        if url:
+            return RedirectResponse(url, status_code=307)
+
+    if not await backend.exists(key):
+        raise FileNotFoundError(key)
+
+    return StreamingResponse(
+        backend.get_stream(key),
+        media_type=media_type or "application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
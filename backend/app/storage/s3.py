@@ -0,0 +1,199 @@
+"""
+S3-compatible storage (AWS S3, MinIO, Cloudflare R2, ...)
+Requests are signed with AWS Signature Version 4 and sent with httpx, so no
+AWS SDK is required. Set an endpoint URL to use path-style addressing
+against MinIO or another local stand-in.
+"""
+import hashlib
+import hmac
+import os
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import quote
+
+import aiofiles
+import httpx
+
+from app.storage.base import StorageBackend, StorageError, DEFAULT_CHUNK_SIZE
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode(), hashlib.sha256).digest()
+
+
+def _encode(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+class S3Storage(StorageBackend):
+    def __init__(
+        self,
+        bucket: str,
+        access_key_id: str,
+        secret_access_key: str,
+        region: str = "us-east-1",
+        endpoint_url: str = "",
+        timeout: float = 30.0
+    ):
+        self.bucket = bucket
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.region = region
+        self.timeout = timeout
+
+        if endpoint_url:
+            # Path-style: {endpoint}/{bucket}/{key}
+            self._base_url = f"{endpoint_url.rstrip('/')}/{bucket}"
+        else:
+            self._base_url = f"https://{bucket}.s3.{region}.amazonaws.com"
+        base = httpx.URL(self._base_url)
+        self._host = base.netloc.decode()
+        self._origin = f"{base.scheme}://{self._host}"
+        self._base_path = base.path.rstrip("/")
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    # --- SigV4 -------------------------------------------------------------
+
+    def _canonical_uri(self, key: str) -> str:
+        return _encode(f"{self._base_path}/{key.lstrip('/')}", safe="-_.~/")
+
+    def _scope(self, now: datetime) -> Tuple[str, str, str]:
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = now.strftime("%Y%m%d")
+        return amz_date, date_stamp, f"{date_stamp}/{self.region}/s3/aws4_request"
+
+    def _signature(self, date_stamp: str, string_to_sign: str) -> str:
+        key = _hmac(f"AWS4{self.secret_access_key}".encode(), date_stamp)
+        for part in (self.region, "s3", "aws4_request"):
+            key = _hmac(key, part)
+        return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    def _sign(
+        self,
+        method: str,
+        canonical_uri: str,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        payload_hash: str,
+        now: datetime
+    ) -> str:
+        amz_date, date_stamp, scope = self._scope(now)
+        canonical_query = "&".join(f"{_encode(k)}={_encode(v)}" for k, v in sorted(query.items()))
+        signed = sorted(k.lower() for k in headers)
+        canonical_headers = "".join(f"{k}:{headers[k].strip()}\n" for k in signed)
+        canonical_request = "\n".join([
+            method, canonical_uri, canonical_query, canonical_headers, ";".join(signed), payload_hash
+        ])
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()
+        ])
+        return self._signature(date_stamp, string_to_sign)
+
+    def _signed_headers(
+        self,
+        method: str,
+        key: str,
+        payload_hash: str = EMPTY_SHA256,
+        extra: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        now = datetime.now(timezone.utc)
+        amz_date, _, scope = self._scope(now)
+        headers = {
+            "host": self._host,
+            "x-amz-date": amz_date,
+            "x-amz-content-sha256": payload_hash,
+            **{k.lower(): v for k, v in (extra or {}).items()},
+        }
+        signature = self._sign(method, self._canonical_uri(key), {}, headers, payload_hash, now)
+        headers["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key_id}/{scope}, "
+            f"SignedHeaders={';'.join(sorted(headers))}, Signature={signature}"
+        )
+        del headers["host"]  # httpx sets it from the URL
+        return headers
+
+    def _url(self, key: str) -> str:
+        return f"{self._origin}{self._canonical_uri(key)}"
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, key: str) -> None:
+        if response.status_code == 404:
+            raise FileNotFoundError(key)
+        if response.status_code >= 300:
+            raise StorageError(f"S3 {response.request.method} {key} failed: {response.status_code}")
+
+    # --- StorageBackend ----------------------------------------------------
+
+    async def put_file(self, key: str, path: str, content_type: Optional[str] = None) -> None:
+        size = os.path.getsize(path)
+        extra = {"content-length": str(size)}
+        if content_type:
+            extra["content-type"] = content_type
+
+        async def body() -> AsyncIterator[bytes]:
+            async with aiofiles.open(path, 'rb') as f:
+                while chunk := await f.read(DEFAULT_CHUNK_SIZE):
+                    yield chunk
+
+        headers = self._signed_headers("PUT", key, UNSIGNED_PAYLOAD, extra)
+        response = await self.client.put(self._url(key), content=body(), headers=headers)
+        self._raise_for_status(response, key)
+        os.remove(path)
+
+    async def get_stream(self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        headers = self._signed_headers("GET", key)
+        async with self.client.stream("GET", self._url(key), headers=headers) as response:
+            self._raise_for_status(response, key)
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def delete(self, key: str) -> None:
+        response = await self.client.delete(self._url(key), headers=self._signed_headers("DELETE", key))
+        if response.status_code != 404:
+            self._raise_for_status(response, key)
+
+    async def exists(self, key: str) -> bool:
+        response = await self.client.head(self._url(key), headers=self._signed_headers("HEAD", key))
+        if response.status_code == 404:
+            return False
+        self._raise_for_status(response, key)
+        return True
+
+    async def presigned_url(
+        self,
+        key: str,
+        expires_in: int,
+        filename: Optional[str] = None
+    ) -> Optional[str]:
+        now = datetime.now(timezone.utc)
+        amz_date, date_stamp, scope = self._scope(now)
+        query = {
+            "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+            "X-Amz-Credential": f"{self.access_key_id}/{scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": "host",
+        }
+        if filename:
+            query["response-content-disposition"] = f'attachment; filename="{filename}"'
+
+        signature = self._sign(
+            "GET", self._canonical_uri(key), query, {"host": self._host}, UNSIGNED_PAYLOAD, now
+        )
+        query["X-Amz-Signature"] = signature
+        query_string = "&".join(f"{_encode(k)}={_encode(v)}" for k, v in sorted(query.items()))
+        return f"{self._url(key)}?{query_string}"
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
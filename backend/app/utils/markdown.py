@@ -1,15 +1,46 @@
-import markdown
-from markdown.extensions.tables import TableExtension
-from markdown.extensions.fenced_code import FencedCodeExtension
-
-
-def render_markdown(content: str) -> str:
-    """Convert markdown content to HTML."""
-    md = markdown.Markdown(
-        extensions=[
-            TableExtension(),
-            FencedCodeExtension(),
-            'nl2br'
-        ]
-    )
-    return md.convert(content)
\ No newline at end of file
+import threading
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    import markdown
+
+# Extension sets: FULL for the policy HTML endpoint, PLAIN (none, as
+# markdown.markdown() uses) for audit exports
+FULL = "full"
+PLAIN = "plain"
+
+# Building a converter loads its extensions; each thread keeps one per flavor and resets it after use
+_local = threading.local()
+
+
+def _extensions(flavor: str) -> List[Any]:
+    if flavor == PLAIN:
+        return []
+    if flavor != FULL:
+        raise ValueError(f"Unknown markdown flavor {flavor!r}")
+    from markdown.extensions.tables import TableExtension
+    from markdown.extensions.fenced_code import FencedCodeExtension
+
+    return [TableExtension(), FencedCodeExtension(), 'nl2br']
+
+
+def _converter(flavor: str) -> "markdown.Markdown":
+    # Imported on first render: markdown isn't needed to boot
+    import markdown
+
+    converters = getattr(_local, "converters", None)
+    if converters is None:
+        converters = _local.converters = {}
+    md = converters.get(flavor)
+    if md is None:
+        md = converters[flavor] = markdown.Markdown(extensions=_extensions(flavor))
+    return md
+
+
+def render_markdown(content: str, flavor: str = FULL) -> str:
+    """Convert markdown content to HTML with the ``flavor`` extension set."""
+    md = _converter(flavor)
+    try:
+        return md.convert(content)
+    finally:
+        md.reset()
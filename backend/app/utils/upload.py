@@ -0,0 +1,74 @@
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+
+import aiofiles
+from fastapi import UploadFile
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured maximum size."""
+
+    def __init__(self, max_size: int):
+        super().__init__(f"File exceeds maximum size of {max_size} bytes")
+        self.max_size = max_size
+
+
+@dataclass(frozen=True)
+class SpooledUpload:
+    path: str
+    sha256: str
+    size: int
+
+
+async def spool_upload(
+    file: UploadFile,
+    directory: str,
+    max_size: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> SpooledUpload:
+    """
+    Stream an upload to a temporary file in fixed-size chunks, hashing as it goes.
+
+    Memory use is bounded by ``chunk_size`` regardless of upload size. The
+    caller moves the temporary file into place (e.g. with ``os.replace``)
+    once it knows the final name, so readers never see a partial file.
+
+    Args:
+        file: Incoming upload
+        directory: Directory for the temporary file; same filesystem as the destination
+        max_size: Maximum allowed size in bytes
+        chunk_size: Bytes read per iteration
+
+    Returns:
+        SpooledUpload with the temporary path, SHA-256 hex digest and size
+
+    Raises:
+        UploadTooLargeError: If the upload is larger than ``max_size``
+    """
+    # Starlette knows the size once the multipart body is parsed; fail fast when it does
+    if file.size is not None and file.size > max_size:
+        raise UploadTooLargeError(max_size)
+
+    os.makedirs(directory, exist_ok=True)
+    temp_path = os.path.join(directory, f"{uuid.uuid4().hex}.part")
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, 'wb') as out:
+            while chunk := await file.read(chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(max_size)
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return SpooledUpload(path=temp_path, sha256=digest.hexdigest(), size=size)
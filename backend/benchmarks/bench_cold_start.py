@@ -0,0 +1,110 @@
+"""
+Benchmark: cold start time and memory of the API process
+Each run starts a fresh interpreter, imports app.main, runs the lifespan
+and serves one request, then reports timings, peak RSS and which of the
+lazily loaded modules were imported before the first request
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only the seeding, policy generation, export and migration paths need these
+LAZY_MODULES = (
+    "alembic",
+    "markdown",
+    "app.services.audit_export",
+    "app.services.control_seeder",
+    "app.services.policy_generator",
+)
+
+CHILD = r"""
+import json, resource, sys, time
+
+def peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+rss_import = peak_rss_mb()
+
+from fastapi.testclient import TestClient
+client = TestClient(app.main.app)
+lifespan_started = time.perf_counter()
+with client:
+    ready = time.perf_counter()
+    lazy_loaded = [m for m in LAZY_MODULES if m in sys.modules]
+    client.get("/health").raise_for_status()
+    served = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - lifespan_started) * 1000,
+    "first_request_ms": (served - ready) * 1000,
+    "rss_import_mb": rss_import,
+    "rss_peak_mb": peak_rss_mb(),
+    "lazy_loaded": lazy_loaded,
+}))
+"""
+
+
+def run_once(python: str) -> Dict:
+    env = dict(
+        os.environ,
+        PYTHONPATH=BACKEND_DIR,
+        DATABASE_URL="sqlite+aiosqlite://",
+        SECRET_KEY="benchmark",
+        STARTUP_SCHEMA_CHECK="off",
+        DB_POOL_WARMUP_CONNECTIONS="0",
+        EXPORT_QUEUE_BACKEND="memory",
+        NEON_AUTH_URL="",
+    )
+    code = f"LAZY_MODULES = {LAZY_MODULES!r}\n{CHILD}"
+    # Run in a scratch directory: startup creates app.log and the storage folders
+    with tempfile.TemporaryDirectory() as workdir:
+        result = subprocess.run(
+            [python, "-c", code], cwd=workdir, env=env, capture_output=True, text=True, check=True
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs: int, max_import_ms: float, max_rss_mb: float) -> int:
+    python = sys.executable
+    run_once(python)  # writes .pyc files, so every measured run has a warm bytecode cache
+    samples: List[Dict] = [run_once(python) for _ in range(runs)]
+
+    print(f"{runs} cold starts")
+    for key, unit in (("import_ms", "ms"), ("startup_ms", "ms"), ("first_request_ms", "ms"),
+                      ("rss_import_mb", "MB"), ("rss_peak_mb", "MB")):
+        values = [s[key] for s in samples]
+        print(f"  {key:<18} median {statistics.median(values):>8.1f} {unit}   min {min(values):>8.1f} {unit}")
+
+    failures = []
+    lazy_loaded = sorted({m for s in samples for m in s["lazy_loaded"]})
+    if lazy_loaded:
+        failures.append(f"loaded before the first request: {', '.join(lazy_loaded)}")
+    if max_import_ms and statistics.median(s["import_ms"] for s in samples) > max_import_ms:
+        failures.append(f"median import time above {max_import_ms:.0f}ms")
+    if max_rss_mb and statistics.median(s["rss_peak_mb"] for s in samples) > max_rss_mb:
+        failures.append(f"median peak RSS above {max_rss_mb:.0f}MB")
+
+    for failure in failures:
+        print(f"FAIL  {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=0, help="fail above this median (0 = no limit)")
+    parser.add_argument("--max-rss-mb", type=float, default=0, help="fail above this median (0 = no limit)")
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.max_import_ms, args.max_rss_mb))
@@ -0,0 +1,82 @@
+"""
+Benchmark: control status engine vs. per-control lookups
+Shows that the number of queries stays flat as the control library grows
+"""
+import asyncio
+import random
+
+from sqlalchemy import insert, select
+
+from benchmarks.common import QueryCounter, create_bench_engine, session_maker, timer
+from app.db.models import Framework, Control, Evidence, Task
+from app.services.control_status import get_control_statuses, NOT_STARTED
+
+ORG_ID = 1
+TASK_STATUSES = ["Pending", "In Progress", "Completed", "Blocked"]
+
+
+async def seed(session, n_controls: int) -> None:
+    await session.execute(insert(Framework).values(id=1, name="SOC 2"))
+    await session.execute(insert(Control), [
+        {"id": i, "framework_id": 1, "control_code": f"CC{i}", "title": f"Control {i}", "description": "-"}
+        for i in range(1, n_controls + 1)
+    ])
+    rng = random.Random(n_controls)
+    await session.execute(insert(Evidence), [
+        {"control_id": rng.randint(1, n_controls), "organization_id": ORG_ID, "uploaded_by": 1,
+         "file_name": f"f{i}.pdf", "file_url": f"/tmp/f{i}.pdf"}
+        for i in range(n_controls * 2)
+    ])
+    await session.execute(insert(Task), [
+        {"control_id": rng.randint(1, n_controls), "organization_id": ORG_ID, "title": f"t{i}",
+         "status": rng.choice(TASK_STATUSES)}
+        for i in range(n_controls * 2)
+    ])
+    await session.commit()
+
+
+async def legacy_statuses(session, control_ids):
+    """The previous per-control implementation, kept for comparison"""
+    statuses = {}
+    for control_id in control_ids:
+        evidence = (await session.execute(select(Evidence).where(
+            Evidence.control_id == control_id, Evidence.organization_id == ORG_ID))).scalars().all()
+        tasks = (await session.execute(select(Task).where(
+            Task.control_id == control_id, Task.organization_id == ORG_ID))).scalars().all()
+        statuses[control_id] = (len(evidence), len(tasks))
+    return statuses
+
+
+async def run(n_controls: int) -> None:
+    engine = await create_bench_engine()
+    counter = QueryCounter(engine)
+    async with session_maker(engine)() as session:
+        await seed(session, n_controls)
+        control_ids = list(range(1, n_controls + 1))
+
+        counter.reset()
+        with timer() as legacy_ms:
+            legacy = await legacy_statuses(session, control_ids)
+        legacy_queries = counter.count
+
+        counter.reset()
+        with timer() as engine_ms:
+            statuses = await get_control_statuses(session, ORG_ID)
+        engine_queries = counter.count
+
+    for control_id, counts in legacy.items():
+        status = statuses.get(control_id, NOT_STARTED)
+        assert (status.evidence_count, status.task_count) == counts, control_id
+
+    print(f"{n_controls:>6} controls | legacy: {legacy_queries:>5} queries {legacy_ms[0]:>9.1f}ms "
+          f"| engine: {engine_queries:>2} queries {engine_ms[0]:>7.1f}ms")
+    await engine.dispose()
+
+
+async def main() -> None:
+    for n in (10, 80, 500, 2000):
+        await run(n)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+Benchmark: request throughput with the logging middleware
+Compares the pure ASGI LoggingMiddleware against the previous
+BaseHTTPMiddleware implementation on a trivial JSON endpoint
+"""
+import argparse
+import asyncio
+import io
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from benchmarks.common import timer  # sets required settings before app imports
+from app.core.logging_config import JSONFormatter, LogStatus
+from app.middleware.logging_middleware import LoggingMiddleware, logger
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous middleware: two f-string records per request"""
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        method, path = request.method, request.url.path
+        client_ip = request.client.host if request.client else "unknown"
+        logger.info(f"⏳ {method} {path} - Request from {client_ip}", extra={"status": LogStatus.PENDING})
+        response = await call_next(request)
+        duration = (time.time() - start_time) * 1000
+        logger.info(
+            f"{LogStatus.SUCCESS.value} {method} {path} - {response.status_code} ({duration:.2f}ms)",
+            extra={"status": LogStatus.SUCCESS, "method": method, "path": path,
+                   "status_code": response.status_code, "duration_ms": round(duration, 2),
+                   "client_ip": client_ip}
+        )
+        return response
+
+
+def build_app(middleware=None, **options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if middleware:
+        app.add_middleware(middleware, **options)
+    return app
+
+
+async def requests_per_second(app: FastAPI, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(n: int) -> None:
+            for _ in range(n):
+                (await client.get("/ping")).raise_for_status()
+
+        await worker(50)  # warm up
+        with timer() as elapsed_ms:
+            await asyncio.gather(*(worker(total // concurrency) for _ in range(concurrency)))
+    return total / (elapsed_ms[0] / 1000)
+
+
+async def main(total: int, concurrency: int) -> None:
+    # Format every record as the file handler would, into memory
+    root = logging.getLogger("compliance_checkpoint")
+    root.handlers = [logging.StreamHandler(io.StringIO())]
+    root.handlers[0].setFormatter(JSONFormatter())
+    root.setLevel(logging.INFO)
+
+    cases = [
+        ("no middleware", build_app()),
+        ("BaseHTTPMiddleware (before)", build_app(LegacyLoggingMiddleware)),
+        ("pure ASGI (after)", build_app(LoggingMiddleware)),
+        ("pure ASGI, 10% of 2xx sampled", build_app(LoggingMiddleware, success_sample_rate=0.1)),
+    ]
+    print(f"{total} requests, concurrency {concurrency}")
+    for name, app in cases:
+        rps = await requests_per_second(app, total, concurrency)
+        print(f"  {name:<32} {rps:>8.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,74 @@
+"""
+Benchmark: login latency under concurrent load
+Compares argon2 verification on the event loop against the bounded hash pool,
+measuring both login latency and how long unrelated requests are stalled
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from benchmarks.common import timer  # sets required settings before app imports
+from app.core.hashing import PasswordHashPool
+from app.core.security import pwd_context
+
+PASSWORD = "correct horse battery staple"
+
+
+def percentile(samples: List[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+async def run_load(verify: Callable[[str, str], Awaitable[bool]], hashed: str, logins: int) -> None:
+    login_ms: List[float] = []
+    other_ms: List[float] = []
+    done = asyncio.Event()
+
+    async def login() -> None:
+        started = time.perf_counter()
+        await asyncio.sleep(0.002)  # user lookup
+        assert await verify(PASSWORD, hashed)
+        login_ms.append((time.perf_counter() - started) * 1000)
+
+    async def other_requests() -> None:
+        # A cheap request every 5ms; its extra latency is how long the loop was blocked
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            other_ms.append((time.perf_counter() - started) * 1000 - 5)
+
+    background = asyncio.create_task(other_requests())
+    with timer() as total_ms:
+        await asyncio.gather(*(login() for _ in range(logins)))
+    done.set()
+    await background
+
+    print(f"  {logins} logins in {total_ms[0]:.0f}ms | login p50 {percentile(login_ms, 50):.0f}ms "
+          f"p99 {percentile(login_ms, 99):.0f}ms | other requests delayed p99 {percentile(other_ms, 99):.1f}ms "
+          f"max {max(other_ms):.1f}ms")
+
+
+async def main(logins: int, workers: int) -> None:
+    hashed = pwd_context.hash(PASSWORD)
+
+    async def inline_verify(password: str, hashed_password: str) -> bool:
+        return pwd_context.verify(password, hashed_password)
+
+    pool = PasswordHashPool(workers=workers, max_queue=logins)
+
+    print("argon2 on the event loop (before)")
+    await run_load(inline_verify, hashed, logins)
+
+    print(f"bounded hash pool, {workers} workers (after)")
+    await run_load(lambda p, h: pool.run(pwd_context.verify, p, h), hashed, logins)
+    print(f"  pool histogram p99: {pool.latency.percentile(99)}ms")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.workers))
@@ -0,0 +1,62 @@
+"""
+Benchmark: rendering policy Markdown to HTML
+Compares a new converter per call (the previous exports and render_markdown)
+with the per-thread pooled converter and the (policy id, version) cache
+"""
+import argparse
+
+import markdown
+from markdown.extensions.fenced_code import FencedCodeExtension
+from markdown.extensions.tables import TableExtension
+
+from benchmarks.common import timer  # sets required settings before app imports
+from app.services.policy_generator import POLICY_TEMPLATES, generate_policy_content
+from app.services.policy_renderer import render_policy_html
+from app.utils.markdown import render_markdown
+
+
+def new_converter() -> markdown.Markdown:
+    return markdown.Markdown(extensions=[TableExtension(), FencedCodeExtension(), 'nl2br'])
+
+
+def render_new_converter(policy_id: int, content: str) -> str:
+    # As render_markdown did: building the converter loads every extension again
+    return new_converter().convert(content)
+
+
+def render_pooled(policy_id: int, content: str) -> str:
+    return render_markdown(content)
+
+
+def render_cached(policy_id: int, content: str) -> str:
+    return render_policy_html(policy_id, 1, content)
+
+
+def main(iterations: int) -> None:
+    policies = [
+        (policy_id, generate_policy_content(policy_type, "Acme Corp")[1])
+        for policy_id, policy_type in enumerate(POLICY_TEMPLATES, start=1)
+    ]
+    renders = iterations * len(policies)
+
+    cases = [
+        ("converter setup alone", lambda policy_id, content: new_converter()),
+        ("markdown.markdown (export)", lambda policy_id, content: markdown.markdown(content)),
+        ("new converter (before)", render_new_converter),
+        ("pooled converter", render_pooled),
+        ("pooled + cached (after)", render_cached),
+    ]
+    print(f"{len(policies)} policies x {iterations} iterations")
+    for name, render in cases:
+        with timer() as elapsed_ms:
+            for _ in range(iterations):
+                for policy_id, content in policies:
+                    render(policy_id, content)
+        print(f"  {name:<28} {elapsed_ms[0] * 1000 / renders:>9.1f} µs/render")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,50 @@
+"""
+Benchmark: rendering every policy template
+Compares str.format over the raw templates (the previous implementation)
+with joining the pre-split segments
+"""
+import argparse
+from datetime import datetime, timezone
+
+from benchmarks.common import timer  # sets required settings before app imports
+from app.services.policy_generator import POLICY_TEMPLATES, generate_policy_content
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli"]
+
+
+def render_with_format(policy_type: str, company_name: str, date: str):
+    # As generate_policy_content did, including formatting the date on every call
+    template = POLICY_TEMPLATES[policy_type]
+    return template["title"], template["content"].format(
+        company_name=company_name, date=datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    )
+
+
+def render_segments(policy_type: str, company_name: str, date: str):
+    return generate_policy_content(policy_type, company_name)
+
+
+def main(iterations: int) -> None:
+    date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    policy_types = list(POLICY_TEMPLATES)
+    renders = iterations * len(policy_types) * len(COMPANIES)
+
+    cases = [
+        ("str.format (before)", render_with_format),
+        ("pre-split segments (after)", render_segments),
+    ]
+    print(f"{len(policy_types)} templates x {len(COMPANIES)} companies x {iterations} iterations")
+    for name, render in cases:
+        with timer() as elapsed_ms:
+            for _ in range(iterations):
+                for policy_type in policy_types:
+                    for company in COMPANIES:
+                        render(policy_type, company, date)
+        print(f"  {name:<30} {elapsed_ms[0] * 1000 / renders:>8.2f} µs/render")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,66 @@
+"""
+Shared helpers for benchmark scripts
+Benchmarks run against an in-memory SQLite database so they need no server
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+# Settings are required at import time; benchmarks never touch the real database
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.models import User, Framework, Control, Policy, Evidence, Task, AuditExport  # noqa: E402
+
+# Organization uses a Postgres ARRAY column, so it is left out of the SQLite schema
+BENCH_TABLES = [Base.metadata.tables[m.__tablename__] for m in (User, Framework, Control, Policy, Evidence, Task, AuditExport)]
+
+
+class QueryCounter:
+    """Counts statements executed on an engine"""
+
+    def __init__(self, engine: AsyncEngine):
+        self.count = 0
+        self.statements: List[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.statements.clear()
+
+
+async def create_bench_engine() -> AsyncEngine:
+    """Create an in-memory SQLite engine with the benchmark tables"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=BENCH_TABLES))
+    return engine
+
+
+def session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@contextmanager
+def timer() -> Iterator[List[float]]:
+    """Yield a one-element list that receives the elapsed milliseconds"""
+    elapsed = [0.0]
+    start = time.perf_counter()
+    try:
+        yield elapsed
+    finally:
+        elapsed[0] = (time.perf_counter() - start) * 1000
@@ -0,0 +1,179 @@
+"""
+Check that every hot query can be answered from one of its intended indexes
+
+Runs EXPLAIN for each query against DATABASE_URL (migrated to head) and
+exits non-zero if a plan doesn't use an expected index. Sequential scans
+are disabled for the check, since on near-empty tables the planner prefers
+them regardless of indexes. SQLite is supported for a quick local run
+against an in-memory schema.
+
+Usage (from the backend directory):
+    python -m scripts.check_query_plans
+"""
+import asyncio
+import json
+import os
+import sys
+from datetime import date, datetime
+from typing import Any, Iterator, List, Sequence, Set, Tuple
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import func, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection  # noqa: E402
+from sqlalchemy.sql import Select  # noqa: E402
+
+from app.api.v1.audits import EXPORT_ORDER  # noqa: E402
+from app.api.v1.evidence import EVIDENCE_ORDER  # noqa: E402
+from app.api.v1.policies import POLICY_ORDER  # noqa: E402
+from app.api.v1.tasks import TASK_ORDER  # noqa: E402
+from app.core.pagination import SortKey, keyset_after  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import engine  # noqa: E402
+from app.db.models.audit_export import AuditExport  # noqa: E402
+from app.db.models.control import Control  # noqa: E402
+from app.db.models.evidence import Evidence  # noqa: E402
+from app.db.models.policy import Policy  # noqa: E402
+from app.db.models.task import Task  # noqa: E402
+
+
+def next_page(query: Select, order: Sequence[SortKey], cursor: Sequence[Any]) -> Select:
+    """A list endpoint's query for the page after ``cursor``"""
+    return query.where(keyset_after(order, cursor)).order_by(*(key.order_by() for key in order)).limit(101)
+
+
+# (description, query, indexes any of which satisfies it)
+HOT_QUERIES: List[Tuple[str, Select, Set[str]]] = [
+    (
+        "list evidence page",
+        next_page(select(Evidence).where(Evidence.organization_id == 1), EVIDENCE_ORDER, [datetime(2026, 1, 1), 100]),
+        {"ix_evidence_org_created"},
+    ),
+    (
+        "list evidence for a control page",
+        next_page(
+            select(Evidence).where(Evidence.organization_id == 1, Evidence.control_id == 1),
+            EVIDENCE_ORDER, [datetime(2026, 1, 1), 100]
+        ),
+        {"ix_evidence_org_control_created"},
+    ),
+    (
+        "latest evidence version on upload",
+        select(Evidence)
+        .where(Evidence.organization_id == 1, Evidence.control_id == 1, Evidence.file_name == "report.pdf")
+        .order_by(Evidence.version.desc()),
+        {"ix_evidence_org_control_file_version"},
+    ),
+    (
+        "evidence blob reference count",
+        select(func.count(Evidence.id)).where(Evidence.organization_id == 1, Evidence.file_url == "uploads/x"),
+        {"ix_evidence_org_file_url"},
+    ),
+    (
+        "evidence counts per control",
+        select(Evidence.control_id, func.count(Evidence.id))
+        .where(Evidence.organization_id == 1)
+        .group_by(Evidence.control_id),
+        {"ix_evidence_org_control_created", "ix_evidence_org_control_file_version", "ix_evidence_org_created"},
+    ),
+    (
+        "list tasks page",
+        next_page(select(Task).where(Task.organization_id == 1), TASK_ORDER, [date(2026, 1, 1), 100]),
+        {"ix_tasks_org_due"},
+    ),
+    (
+        "list tasks by status",
+        select(Task).where(Task.organization_id == 1, Task.status == "Pending"),
+        {"ix_tasks_org_status"},
+    ),
+    (
+        "task counts per control",
+        select(Task.control_id, func.count(Task.id)).where(Task.organization_id == 1).group_by(Task.control_id),
+        {"ix_tasks_org_control", "ix_tasks_org_status"},
+    ),
+    (
+        "my tasks",
+        select(Task).where(Task.owner_id == 1).order_by(Task.due_date.asc().nullslast()),
+        {"ix_tasks_owner_due"},
+    ),
+    (
+        "list policies page",
+        next_page(select(Policy).where(Policy.organization_id == 1), POLICY_ORDER, [datetime(2026, 1, 1), 100]),
+        {"ix_policies_org_created"},
+    ),
+    (
+        "framework controls",
+        select(Control).where(Control.framework_id == 1).order_by(Control.control_code),
+        {"uq_controls_framework_code"},
+    ),
+    (
+        "list audit exports page",
+        next_page(
+            select(AuditExport).where(AuditExport.organization_id == 1), EXPORT_ORDER, [datetime(2026, 1, 1), 100]
+        ),
+        {"ix_audit_exports_org_created"},
+    ),
+    (
+        "claim next export job",
+        select(AuditExport.id).where(AuditExport.status == "Pending").order_by(AuditExport.created_at).limit(1),
+        {"ix_audit_exports_status_created"},
+    ),
+]
+
+
+def _plan_indexes(node: Any) -> Iterator[str]:
+    """Index names anywhere in a Postgres JSON plan."""
+    if isinstance(node, dict):
+        if "Index Name" in node:
+            yield node["Index Name"]
+        for value in node.values():
+            yield from _plan_indexes(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _plan_indexes(item)
+
+
+async def used_indexes(conn: AsyncConnection, query: Select) -> Tuple[Set[str], str]:
+    sql = str(query.compile(conn.sync_connection, compile_kwargs={"literal_binds": True}))
+
+    if conn.dialect.name == "postgresql":
+        plan = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return set(_plan_indexes(plan)), json.dumps(plan, indent=2)
+
+    # SQLite: "SEARCH evidence USING INDEX ix_... (organization_id=?)"
+    rows = (await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))).all()
+    details = [row[-1] for row in rows]
+    found = {
+        detail.split("INDEX ", 1)[1].split(" ", 1)[0]
+        for detail in details
+        if "INDEX " in detail
+    }
+    return found, "\n".join(details)
+
+
+async def check() -> bool:
+    ok = True
+    async with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SET enable_seqscan = off"))
+        elif conn.dialect.name == "sqlite":
+            tables = [t for t in Base.metadata.sorted_tables if t.name != "organizations"]
+            await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=tables))
+
+        for description, query, expected in HOT_QUERIES:
+            found, plan = await used_indexes(conn, query)
+            if found & expected:
+                print(f"ok    {description}: {', '.join(sorted(found & expected))}")
+            else:
+                ok = False
+                print(f"FAIL  {description}: expected one of {sorted(expected)}, plan:\n{plan}")
+
+        await conn.rollback()
+    await engine.dispose()
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(check()) else 1)
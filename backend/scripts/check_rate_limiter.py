@@ -0,0 +1,141 @@
+"""
+Check both rate limit backends against a simulated clock
+
+Replays the same request sequences through MemoryRateLimiter and
+PostgresRateLimiter and exits non-zero if a decision or Retry-After is
+wrong. The Postgres backend runs its real upsert against an in-memory
+SQLite database, so no server is needed.
+
+Checked:
+  - a burst gets exactly ``limit`` requests in, and Retry-After points at
+    the first instant a retry succeeds;
+  - rejected requests don't count: hammering during the wait doesn't
+    push Retry-After back;
+  - (Postgres) the estimate weights the previous window by its overlap.
+
+Usage (from the backend directory):
+    python -m scripts.check_rate_limiter
+"""
+import asyncio
+import os
+import sys
+from typing import Callable, List, Tuple
+
+sys.path.append(os.getcwd())
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("SECRET_KEY", "check")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.models.rate_limit import RateLimitBucket  # noqa: E402
+from app.ratelimit import MemoryRateLimiter, PostgresRateLimiter, RateLimitBackend  # noqa: E402
+
+WINDOW = 60.0
+LIMIT = 10
+EPSILON = 0.01
+START = 1_000_020.0  # Start of a fixed window, so Postgres windows line up with the scenarios
+
+
+class Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+failures: List[str] = []
+
+
+def check(condition: bool, message: str) -> None:
+    print(f"  {'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+async def burst_and_retry(backend: RateLimitBackend, clock: Clock) -> None:
+    allowed = [(await backend.hit("burst", LIMIT, WINDOW)).allowed for _ in range(LIMIT + 1)]
+    check(allowed == [True] * LIMIT + [False], f"a burst of {LIMIT + 1} lets exactly {LIMIT} in")
+
+    clock.now += 5
+    rejected = await backend.hit("burst", LIMIT, WINDOW)
+    retry_at = clock.now + rejected.retry_after
+
+    # Hammer the limiter until just before Retry-After
+    while clock.now + 1 < retry_at - EPSILON:
+        clock.now += 1
+        result = await backend.hit("burst", LIMIT, WINDOW)
+        check_retry = abs(clock.now + result.retry_after - retry_at) < EPSILON
+        if result.allowed or not check_retry:
+            break
+    check(not result.allowed and check_retry, "rejected retries don't move Retry-After")
+
+    clock.now = retry_at - EPSILON
+    check(not (await backend.hit("burst", LIMIT, WINDOW)).allowed, "rejected just before Retry-After")
+    clock.now = retry_at + EPSILON
+    check((await backend.hit("burst", LIMIT, WINDOW)).allowed, "allowed just after Retry-After")
+
+
+async def spread_out(backend: RateLimitBackend, clock: Clock, per_window: int) -> None:
+    # Evenly spaced requests at or under the limit never trip it
+    results = []
+    for _ in range(3 * per_window):
+        results.append((await backend.hit("steady", LIMIT, WINDOW)).allowed)
+        clock.now += WINDOW / per_window + EPSILON
+    check(all(results), f"{per_window} requests per window spread evenly are all allowed")
+
+
+async def weighted_previous_window(backend: RateLimitBackend, clock: Clock) -> None:
+    # LIMIT requests at the end of one window, then half-way through the next
+    # the previous window still weighs LIMIT * 0.5, leaving room for half the limit
+    clock.now = START + 10 * WINDOW - 1
+    for _ in range(LIMIT):
+        await backend.hit("weighted", LIMIT, WINDOW)
+    clock.now = START + 10.5 * WINDOW
+    allowed = 0
+    while (result := await backend.hit("weighted", LIMIT, WINDOW)).allowed:
+        allowed += 1
+    check(allowed == LIMIT // 2, f"half-way into the next window {LIMIT // 2} requests fit (got {allowed})")
+
+    # Room for one more once the previous window has decayed by one request
+    expected = (1 - (LIMIT - LIMIT // 2 - 1) / LIMIT - 0.5) * WINDOW
+    check(abs(result.retry_after - expected) < EPSILON, f"Retry-After {result.retry_after:.2f}s, expected {expected:.2f}s")
+
+
+async def memory_backend(clock: Clock) -> RateLimitBackend:
+    return MemoryRateLimiter(clock=clock)
+
+
+async def postgres_backend(clock: Clock) -> RateLimitBackend:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[Base.metadata.tables[RateLimitBucket.__tablename__]]))
+    return PostgresRateLimiter(async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False), clock=clock)
+
+
+async def main() -> None:
+    # The two-window estimate may count up to one request too many
+    backends: List[Tuple[Callable, int]] = [(memory_backend, LIMIT), (postgres_backend, LIMIT - 1)]
+    for make_backend, per_window in backends:
+        print(make_backend.__name__)
+        clock = Clock(START)
+        await burst_and_retry(await make_backend(clock), clock)
+        clock = Clock(START)
+        await spread_out(await make_backend(clock), clock, per_window)
+
+    # The memory backend is exact, so only the estimating backend gets this one
+    print("postgres_backend estimate")
+    clock = Clock(START)
+    await weighted_previous_window(await postgres_backend(clock), clock)
+
+    if failures:
+        print(f"\n{len(failures)} check(s) failed")
+        sys.exit(1)
+    print("\nAll checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,204 @@
+"""
+Check the S3 storage backend against a local S3-compatible server
+
+Runs put/exists/get/presign/delete through S3Storage, whose SigV4 signing
+is hand-written, and exits non-zero if any round trip is wrong. Point it at
+the minio service of docker-compose.yml (the default endpoint and
+credentials), or pass --moto to start a moto server in-process
+(pip install "moto[server]"). The bucket is created if it doesn't exist.
+
+Checked:
+  - a multi-chunk upload under a key that needs percent-encoding reads
+    back byte for byte, and the local source file is consumed;
+  - exists() follows the object's lifetime;
+  - requests signed with the wrong secret are refused, so the server
+    really verifies the signatures the others passed with;
+  - a presigned URL downloads the object without credentials and with
+    the requested Content-Disposition, and stops working when tampered
+    with (MinIO only: moto doesn't verify presigned URLs);
+  - reading a deleted object raises FileNotFoundError, and deleting it
+    again is not an error.
+
+Usage (from the backend directory):
+    docker-compose up -d minio
+    python -m scripts.check_s3_storage
+    python -m scripts.check_s3_storage --moto
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import Any, List, Tuple
+
+sys.path.append(os.getcwd())
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("SECRET_KEY", "check")
+
+import httpx  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.storage import StorageError  # noqa: E402
+from app.storage.s3 import S3Storage  # noqa: E402
+
+KEY = "check/evidence/1/blobs/ab/report Q1+final é.pdf"
+FILENAME = "report Q1 final.pdf"
+CHUNK_SIZE = 64 * 1024
+
+failures: List[str] = []
+
+
+def check(condition: bool, message: str) -> None:
+    print(f"  {'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+async def ensure_bucket(storage: S3Storage) -> None:
+    response = await storage.client.head(storage._url(""), headers=storage._signed_headers("HEAD", ""))
+    if response.status_code == 404:
+        response = await storage.client.put(storage._url(""), headers=storage._signed_headers("PUT", ""))
+    storage._raise_for_status(response, storage.bucket)
+
+
+async def read(storage: S3Storage, key: str) -> bytes:
+    return b"".join([chunk async for chunk in storage.get_stream(key, chunk_size=CHUNK_SIZE)])
+
+
+async def upload_and_read(storage: S3Storage) -> bytes:
+    payload = os.urandom(3 * CHUNK_SIZE + 123)
+    fd, path = tempfile.mkstemp()
+    with os.fdopen(fd, "wb") as f:
+        f.write(payload)
+
+    await storage.put_file(KEY, path, content_type="application/pdf")
+    check(not os.path.exists(path), "put_file consumes the local file")
+    check(await storage.exists(KEY), "exists() after put_file")
+    check(await read(storage, KEY) == payload, f"get_stream returns the {len(payload)} bytes uploaded")
+    return payload
+
+
+async def wrong_secret(storage: S3Storage, endpoint_url: str) -> None:
+    forged = S3Storage(storage.bucket, storage.access_key_id, "wrong-secret", storage.region, endpoint_url)
+    try:
+        await forged.exists(KEY)
+        check(False, "a request signed with the wrong secret is refused")
+    except StorageError:
+        check(True, "a request signed with the wrong secret is refused")
+    finally:
+        await forged.close()
+
+
+async def presigned_download(storage: S3Storage, payload: bytes, verifies_presigned: bool) -> None:
+    url = await storage.presigned_url(KEY, 60, filename=FILENAME)
+    assert url is not None
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url)
+        check(response.status_code == 200 and response.content == payload, "presigned URL downloads the object")
+        disposition = response.headers.get("content-disposition", "")
+        check(FILENAME in disposition, f"presigned URL sets Content-Disposition ({disposition or 'missing'})")
+
+        if verifies_presigned:
+            tampered = url.replace("X-Amz-Expires=60", "X-Amz-Expires=604800")
+            response = await client.get(tampered)
+            check(response.status_code == 403, f"a tampered presigned URL is refused ({response.status_code})")
+
+
+async def delete_and_missing(storage: S3Storage) -> None:
+    await storage.delete(KEY)
+    check(not await storage.exists(KEY), "not exists() after delete")
+    try:
+        await read(storage, KEY)
+        check(False, "get_stream of a deleted object raises FileNotFoundError")
+    except FileNotFoundError:
+        check(True, "get_stream of a deleted object raises FileNotFoundError")
+    await storage.delete(KEY)
+    check(True, "deleting a missing object is not an error")
+
+
+def start_moto() -> Tuple[Any, str, str, str]:
+    """Start a moto server that verifies signatures, with an access key allowed to use S3."""
+    import boto3  # type: ignore[import-not-found]
+    from moto import settings as moto_settings  # type: ignore[import-not-found]
+    from moto.server import ThreadedMotoServer  # type: ignore[import-not-found]
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    endpoint_url = f"http://{host}:{port}"
+
+    # moto only checks signatures of keys it knows, so create one before turning checks on
+    iam = boto3.client(
+        "iam", endpoint_url=endpoint_url, region_name="us-east-1",
+        aws_access_key_id="setup", aws_secret_access_key="setup"
+    )
+    iam.create_user(UserName="check")
+    iam.put_user_policy(UserName="check", PolicyName="s3", PolicyDocument=json.dumps({
+        "Version": "2012-10-17",
+        "Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}],
+    }))
+    access_key = iam.create_access_key(UserName="check")["AccessKey"]
+    moto_settings.INITIAL_NO_AUTH_ACTION_COUNT = 0
+    return server, endpoint_url, access_key["AccessKeyId"], access_key["SecretAccessKey"]
+
+
+def moto_signature_checks(enabled: bool) -> None:
+    from moto import settings as moto_settings  # type: ignore[import-not-found]
+
+    moto_settings.INITIAL_NO_AUTH_ACTION_COUNT = 0 if enabled else float("inf")
+
+
+async def main(
+    endpoint_url: str,
+    bucket: str,
+    access_key_id: str,
+    secret_access_key: str,
+    region: str,
+    moto: bool = False
+) -> None:
+    print(f"S3Storage against {endpoint_url}/{bucket}")
+    storage = S3Storage(bucket, access_key_id, secret_access_key, region, endpoint_url)
+    try:
+        await ensure_bucket(storage)
+        payload = await upload_and_read(storage)
+        await wrong_secret(storage, endpoint_url)
+        if moto:
+            # moto can't verify query-string signatures, so it would reject every presigned URL
+            moto_signature_checks(False)
+        await presigned_download(storage, payload, verifies_presigned=not moto)
+        if moto:
+            moto_signature_checks(True)
+        await delete_and_missing(storage)
+    finally:
+        await storage.close()
+
+    if failures:
+        print(f"\n{len(failures)} check(s) failed")
+        sys.exit(1)
+    print("\nAll checks passed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", default=settings.S3_ENDPOINT_URL or "http://localhost:9000")
+    parser.add_argument("--bucket", default=settings.S3_BUCKET or "compliance-evidence")
+    parser.add_argument("--access-key-id", default=settings.S3_ACCESS_KEY_ID or "minioadmin")
+    parser.add_argument("--secret-access-key", default=settings.S3_SECRET_ACCESS_KEY or "minioadmin")
+    parser.add_argument("--region", default=settings.S3_REGION)
+    parser.add_argument("--moto", action="store_true", help="Start a moto S3 server instead of using --endpoint-url")
+    args = parser.parse_args()
+
+    server = None
+    if args.moto:
+        server, args.endpoint_url, args.access_key_id, args.secret_access_key = start_moto()
+    try:
+        asyncio.run(main(
+            args.endpoint_url, args.bucket, args.access_key_id, args.secret_access_key, args.region, moto=args.moto
+        ))
+    finally:
+        if server is not None:
+            server.stop()
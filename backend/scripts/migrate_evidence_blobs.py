@@ -0,0 +1,84 @@
+"""
+Move evidence files from the legacy {org}/{timestamp}_{filename} layout on
+local disk into the content-addressed blob store of the configured storage
+backend, deduplicating identical files per organization
+
+Usage (from the backend directory):
+    python -m scripts.migrate_evidence_blobs [--dry-run] [--batch-size 200]
+"""
+import argparse
+import asyncio
+import os
+import sys
+from typing import Set
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import select, update  # noqa: E402
+
+from app.db.session import async_session_maker  # noqa: E402
+from app.db.models.evidence import Evidence  # noqa: E402
+from app.services.evidence_store import evidence_store, hash_file  # noqa: E402
+
+
+async def migrate(dry_run: bool, batch_size: int) -> None:
+    moved = deduplicated = repointed = missing = 0
+    last_id = 0
+    seen_blobs: Set[str] = set()
+
+    while True:
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(Evidence.id, Evidence.organization_id, Evidence.file_url, Evidence.file_hash, Evidence.mime_type)
+                .where(Evidence.id > last_id)
+                .order_by(Evidence.id)
+                .limit(batch_size)
+            )
+            batch = result.all()
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            for evidence_id, org_id, file_url, file_hash, mime_type in batch:
+                if evidence_store.is_blob_path(file_url):
+                    continue
+
+                repoint = update(Evidence).where(Evidence.id == evidence_id)
+                if os.path.exists(file_url):
+                    sha256, size = hash_file(file_url)
+                    if file_hash and file_hash != sha256:
+                        print(f"WARNING: evidence {evidence_id} hash mismatch, using on-disk content")
+                    target = evidence_store.blob_path(org_id, sha256)
+                    if target in seen_blobs or await evidence_store.backend.exists(target):
+                        deduplicated += 1
+                    else:
+                        moved += 1
+                    seen_blobs.add(target)
+                    if not dry_run:
+                        await evidence_store.lock(db, target)
+                        blob = await evidence_store.adopt(file_url, org_id, sha256, size, mime_type)
+                        await db.execute(repoint.values(file_url=blob.path, file_hash=blob.sha256, file_size=blob.size))
+                elif file_hash and await evidence_store.backend.exists(evidence_store.blob_path(org_id, file_hash)):
+                    # File was already moved for another row with the same content
+                    repointed += 1
+                    if not dry_run:
+                        target = evidence_store.blob_path(org_id, file_hash)
+                        await evidence_store.lock(db, target)
+                        await db.execute(repoint.values(file_url=target))
+                else:
+                    missing += 1
+                    print(f"WARNING: evidence {evidence_id} file not found: {file_url}")
+
+            if not dry_run:
+                await db.commit()
+
+    prefix = "[dry run] " if dry_run else ""
+    print(f"{prefix}moved: {moved}, deduplicated: {deduplicated}, repointed: {repointed}, missing: {missing}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without touching files")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(migrate(args.dry_run, args.batch_size))
@@ -0,0 +1,35 @@
+"""
+Insert or update the framework and control catalog
+Idempotent: run it after every deploy that changes app/data/control_catalog.json.
+
+Usage (from the backend directory):
+    python scripts/seed_frameworks.py [--file path/to/catalog.json]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.getcwd())
+
+from app.db.session import async_session_maker  # noqa: E402
+from app.services.control_seeder import DEFAULT_CATALOG_PATH, load_catalog_file, seed_controls  # noqa: E402
+
+
+async def seed(path: str) -> None:
+    catalog = load_catalog_file(path)
+    async with async_session_maker() as db:
+        result = await seed_controls(db, catalog)
+
+    print(f"Catalog version {result.catalog_version}")
+    rows = [("Frameworks", result.frameworks), *result.controls.items()]
+    print(f"  {'':<20} {'inserted':>9} {'updated':>9} {'unchanged':>10}")
+    for name, counts in rows:
+        print(f"  {name:<20} {counts.inserted:>9} {counts.updated:>9} {counts.unchanged:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", default=str(DEFAULT_CATALOG_PATH), help="Catalog JSON file")
+    args = parser.parse_args()
+    asyncio.run(seed(args.file))